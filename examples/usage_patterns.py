@@ -1,45 +1,138 @@
 #!/usr/bin/env python3
-"""Example demonstrating both async iterator and subscribe/unsubscribe patterns."""
+"""Example demonstrating both async iterator and subscribe/unsubscribe patterns.
+
+The examples run on uvloop when it is installed (``pip install uvloop``), which
+speeds up network I/O, and fall back to the default asyncio event loop otherwise.
+"""
 
 import asyncio
 import os
 import signal
-from contextlib import suppress
+import sys
+from collections.abc import Awaitable, Callable, Coroutine
+from typing import Any
 
 from nwws_receiver import NoaaPortMessage, WxWire, WxWireConfig
 
+# AWIPS product categories handled as priority alerts
+PRIORITY_PREFIXES: frozenset[str] = frozenset({"TOR", "SVR", "FFW", "EWW"})
+
+
+class BufferedPrinter:
+    """Collect per-message output and write it to stdout in batches.
+
+    Printing every message costs one write() call each, which adds up on a busy
+    feed. Output is buffered and flushed once it grows past max_buffer bytes or
+    flush_interval seconds after the first pending write, whichever comes first.
+    """
+
+    def __init__(self, max_buffer: int = 8192, flush_interval: float = 0.1) -> None:
+        """Initialize the printer with its size and time flush thresholds."""
+        self._buffer = bytearray()
+        self._max_buffer = max_buffer
+        self._flush_interval = flush_interval
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    def write(self, text: str) -> None:
+        """Queue text for output, flushing when the buffer is full."""
+        self._buffer.extend(text.encode())
+        if len(self._buffer) >= self._max_buffer:
+            self.flush()
+        elif self._flush_handle is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                self.flush()
+            else:
+                self._flush_handle = loop.call_later(self._flush_interval, self.flush)
+
+    def flush(self) -> None:
+        """Write all buffered output to stdout."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._buffer:
+            sys.stdout.flush()  # Keep ordering with regular print() output
+            sys.stdout.buffer.write(self._buffer)
+            sys.stdout.buffer.flush()
+            self._buffer.clear()
+
+
+PRINTER = BufferedPrinter()
+
+
+class MessageForwarder:
+    """Subscriber that hands messages to a queue drained by a separate consumer task.
+
+    Calling the forwarder only enqueues the message, so slow output in the consumer
+    never stalls the client's receive path. When the queue is full the message is
+    dropped and counted, making consumer lag visible instead of unbounded.
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        """Initialize the forwarder with a bounded queue."""
+        self.queue: asyncio.Queue[NoaaPortMessage] = asyncio.Queue(maxsize=maxsize)
+        self.dropped = 0
+
+    def __call__(self, message: NoaaPortMessage) -> None:
+        """Enqueue a message received from the client."""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def consume(self, handler: Callable[[NoaaPortMessage], Awaitable[None]]) -> None:
+        """Pass queued messages to the handler until cancelled."""
+        while True:
+            message = await self.queue.get()
+            await handler(message)
+
+    async def report(self, interval: float = 60) -> None:
+        """Periodically report the queue depth and number of dropped messages."""
+        while True:
+            await asyncio.sleep(interval)
+            PRINTER.write(f"[QUEUE] pending: {self.queue.qsize()}, dropped: {self.dropped}\n")
 
-def message_logger(message: NoaaPortMessage) -> None:
+
+async def message_logger(message: NoaaPortMessage) -> None:
     """Log incoming messages to demonstrate subscribe/unsubscribe pattern.
 
     This demonstrates the subscribe/unsubscribe pattern for event-driven processing.
+    Messages reach it through a MessageForwarder queue, so it runs in its own task
+    and awaiting I/O here does not block message processing.
     """
-    print(f"[SUBSCRIBER] Received: {message.awipsid} - {message.subject}")
+    PRINTER.write(f"[SUBSCRIBER] Received: {message.awipsid} - {message.subject}\n")
+    await asyncio.sleep(0)  # Stand-in for async I/O such as a database write
 
 
 def priority_alert_handler(message: NoaaPortMessage) -> None:
-    """Process only priority weather alerts with filtering logic.
+    """Process only priority weather alerts.
 
-    This shows how multiple subscribers can have different filtering logic.
+    This shows how multiple subscribers can have different filtering logic. The
+    handler is registered with PRIORITY_PREFIXES, so the client only calls it for
+    matching products and no filtering is needed here. The client matches prefixes
+    of 1 to 6 characters with one table lookup per distinct prefix length; these
+    three-letter product codes need a single lookup.
     """
-    if message.awipsid.startswith(("TOR", "SVR", "FFW", "EWW")):
-        print(f"[PRIORITY] ⚠️  ALERT: {message.awipsid} - {message.subject}")
+    PRINTER.write(f"[PRIORITY] ⚠️  ALERT: {message.awipsid} - {message.subject}\n")
 
 
 async def async_iterator_consumer(client: WxWire) -> None:
     """Consume messages via async iterator pattern concurrently with subscribers.
 
     This runs concurrently with the subscriber pattern, showing that
-    both can operate simultaneously.
+    both can operate simultaneously. Messages are received in batches so
+    the consumer wakes up once per burst rather than once per message.
     """
     message_count = 0
 
-    async for _message in client:
-        message_count += 1
-        if message_count % 10 == 0:  # Log every 10th message
-            print(f"[ITERATOR] Processed {message_count} messages via async iterator")
+    async for messages in client.batches(max_size=64, max_wait_ms=5):
+        previous_count = message_count
+        message_count += len(messages)
+        if message_count // 10 != previous_count // 10:  # Log every 10 messages
+            PRINTER.write(f"[ITERATOR] Processed {message_count} messages via async iterator\n")
 
-        # Process message here...
+        # Process messages here...
         # For demo, we'll just count them
 
 
@@ -57,82 +150,112 @@ async def main() -> None:
     # Create the client
     client = WxWire(config)
 
-    # Method 1: Subscribe pattern for event-driven processing
+    # Method 1: Subscribe pattern for event-driven processing, with logging
+    # decoupled from the receive path through a queue
     print("Setting up subscribers...")
-    client.subscribe(message_logger)
-    client.subscribe(priority_alert_handler)
+    forwarder = MessageForwarder()
+    client.subscribe(forwarder)
+    client.subscribe(priority_alert_handler, prefixes=PRIORITY_PREFIXES)
     print(f"Active subscribers: {client.subscriber_count}")
 
-    # Method 2: Start async iterator task for streaming processing
-    print("Starting async iterator task...")
-    iterator_task = asyncio.create_task(
-        async_iterator_consumer(client), name="async_iterator_consumer"
-    )
-
     # Set up graceful shutdown
     shutdown_event = asyncio.Event()
 
-    def signal_handler() -> None:
-        print("\nReceived shutdown signal...")
-        shutdown_event.set()
-
-    # Register signal handlers for graceful shutdown
+    # Register signal handlers on the running loop for graceful shutdown, falling
+    # back to signal.signal where the loop does not support them (Windows)
+    loop = asyncio.get_running_loop()
     for sig in (signal.SIGTERM, signal.SIGINT):
-        signal.signal(sig, lambda _s, _f: signal_handler())
+        try:
+            loop.add_signal_handler(sig, shutdown_event.set)
+        except NotImplementedError:
+            signal.signal(sig, lambda *_: loop.call_soon_threadsafe(shutdown_event.set))
 
     try:
-        print("Connecting to NWWS-OI...")
-        success = await client.start()
-        if not success:
-            print("Failed to connect to NWWS-OI")
-            return
-
-        print("Connected! Processing messages...")
-        print("Use Ctrl+C to gracefully shutdown")
+        async with asyncio.TaskGroup() as tg:
+            # Method 2: Start async iterator task for streaming processing
+            print("Starting async iterator task...")
+            tg.create_task(async_iterator_consumer(client), name="async_iterator_consumer")
+            consumer_tasks = (
+                tg.create_task(forwarder.consume(message_logger), name="message_logger"),
+                tg.create_task(forwarder.report(), name="forwarder_report"),
+            )
+
+            print("Connecting to NWWS-OI...")
+            if await client.start():
+                print("Connected! Processing messages...")
+                print("Use Ctrl+C to gracefully shutdown")
+
+                # Wait for shutdown signal
+                await shutdown_event.wait()
+                print("\nReceived shutdown signal...")
+            else:
+                print("Failed to connect to NWWS-OI")
+
+            PRINTER.flush()
+            print("Shutting down...")
+
+            # Stopping the client ends the async iterator; the queue consumers are
+            # cancelled so the task group can exit
+            await client.stop("Example shutdown")
+            for task in consumer_tasks:
+                task.cancel()
 
-        # Wait for shutdown signal
-        await shutdown_event.wait()
-
-    except KeyboardInterrupt:
-        print("\nShutdown requested...")
     finally:
-        print("Shutting down...")
-
-        # Cancel the async iterator task
-        iterator_task.cancel()
-        with suppress(asyncio.CancelledError):
-            await iterator_task
-
-        # Stop the client
+        # No-op if already stopped above; covers errors raised inside the task group
         await client.stop("Example shutdown")
+        PRINTER.flush()
         print("Client stopped.")
 
         # Optionally unsubscribe handlers (not necessary during shutdown)
-        client.unsubscribe(message_logger)
+        client.unsubscribe(forwarder)
         client.unsubscribe(priority_alert_handler)
         print(f"Remaining subscribers: {client.subscriber_count}")
 
 
 async def simple_subscriber_example() -> None:
-    """Run simple example using only the subscriber pattern."""
+    """Run simple example using only the subscriber pattern.
+
+    Runs until 10 messages are received, the client disconnects, or 30 seconds
+    pass, whichever happens first.
+    """
+    message_limit = 10
+    max_run_seconds = 30
+
     config = WxWireConfig(
         username=os.getenv("NWWS_USERNAME", "your_username"),
         password=os.getenv("NWWS_PASSWORD", "your_password"),
     )
 
     client = WxWire(config)
+    done = asyncio.Event()
+    count = 0
 
     # Define a simple handler
     def handle_message(message: NoaaPortMessage) -> None:
-        print(f"Got message: {message.awipsid}")
+        nonlocal count
+        PRINTER.write(f"Got message: {message.awipsid}\n")
+        count += 1
+        if count >= message_limit:
+            done.set()
 
     # Subscribe and run
     client.subscribe(handle_message)
 
     try:
         await client.start()
-        await asyncio.sleep(30)  # Run for 30 seconds
+        waiters = {
+            asyncio.create_task(done.wait()),
+            asyncio.create_task(client.wait_disconnected()),
+        }
+        try:
+            await asyncio.wait(
+                waiters, timeout=max_run_seconds, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
     finally:
+        PRINTER.flush()
         await client.stop()
 
 
@@ -141,6 +264,7 @@ async def simple_iterator_example() -> None:
     config = WxWireConfig(
         username=os.getenv("NWWS_USERNAME", "your_username"),
         password=os.getenv("NWWS_PASSWORD", "your_password"),
+        history=0,  # Only live messages, skip the history replay on join
     )
 
     client = WxWire(config)
@@ -148,33 +272,43 @@ async def simple_iterator_example() -> None:
     try:
         await client.start()
 
-        # Process first 10 messages then exit
+        # Process first 10 messages; the client stops once the last one arrives
         count = 0
-        async for message in client:
-            print(f"Message {count + 1}: {message.awipsid}")
+        async for message in client.stream_first(10):
             count += 1
-            if count >= 10:
-                break
+            print(f"Message {count}: {message.awipsid}")
 
     finally:
         await client.stop()
 
 
+def _fast_loop_factory() -> Callable[[], asyncio.AbstractEventLoop] | None:
+    """Return the uvloop event loop factory if uvloop is installed."""
+    try:
+        import uvloop  # noqa: PLC0415
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
+
+
+def _run(coro: Coroutine[Any, Any, None]) -> None:
+    """Run an example coroutine on the fastest available event loop."""
+    asyncio.run(coro, loop_factory=_fast_loop_factory())
+
+
 def run_examples() -> None:
     """Run examples based on command line arguments or default to main."""
-    import sys
-
     if len(sys.argv) > 1:
         example_type = sys.argv[1].lower()
         if example_type == "subscriber":
             print("Running subscriber-only example...")
-            asyncio.run(simple_subscriber_example())
+            _run(simple_subscriber_example())
         elif example_type == "iterator":
             print("Running iterator-only example...")
-            asyncio.run(simple_iterator_example())
+            _run(simple_iterator_example())
         elif example_type == "main":
             print("Running comprehensive example...")
-            asyncio.run(main())
+            _run(main())
         else:
             print("Usage: python usage_patterns.py [main|subscriber|iterator]")
             print("  main       - Run comprehensive example (default)")
@@ -185,7 +319,7 @@ def run_examples() -> None:
         print(
             "Running comprehensive example (use 'subscriber' or 'iterator' args for alternatives)"
         )
-        asyncio.run(main())
+        _run(main())
 
 
 if __name__ == "__main__":
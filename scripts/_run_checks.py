@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Pre-release check driver for nwws-oi-receiver.
+
+Launched once by release.py through ``uv run`` so the project environment is
+resolved a single time. The external tools are found on the PATH that ``uv run``
+set up and the test suite runs in this process via ``pytest.main``. The checks
+are independent, so the external tools run in worker threads while the tests run.
+"""
+
+import logging
+import subprocess
+import sys
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+# A command of None runs the test suite in-process
+CHECKS: list[tuple[list[str] | None, str]] = [
+    (["ruff", "format", "--check"], "Code formatting"),
+    (["ruff", "check"], "Linting"),
+    (["basedpyright", "src/nwws_receiver"], "Type checking"),
+    (None, "Tests"),
+    ([sys.executable, "scripts/validate_typing.py"], "Typing validation"),
+    ([sys.executable, "-m", "build"], "Build"),
+]
+
+# validate_typing.py may build a wheel and then delete dist/ and build/, so these
+# checks share one worker rather than running alongside each other
+SHARED_BUILD_DIR_CHECKS = frozenset({"Typing validation", "Build"})
+
+
+def run_external_check(cmd: Sequence[str]) -> tuple[int, str, str]:
+    """Run an external check command and return exit code, stdout, stderr.
+
+    Args:
+        cmd: Command and arguments to run
+
+    Returns:
+        Tuple of exit code, stdout, and stderr
+
+    """
+    try:
+        result = subprocess.run(  # noqa: S603
+            cmd,
+            capture_output=True,
+            text=True,
+            check=False,
+            timeout=300,  # 5 minute timeout
+        )
+    except subprocess.TimeoutExpired:
+        return 1, "", "Command timed out"
+    except FileNotFoundError as e:
+        return 1, "", str(e)
+    return result.returncode, result.stdout.strip(), result.stderr.strip()
+
+
+def run_tests() -> tuple[int, str, str]:
+    """Run the test suite in this process.
+
+    pytest is imported here so a missing test dependency group only fails this
+    check instead of the whole driver.
+
+    Returns:
+        Tuple of exit code, stdout, and stderr
+
+    """
+    try:
+        import pytest  # noqa: PLC0415
+    except ImportError as e:
+        return 1, "", str(e)
+    return int(pytest.main(["-q"])), "", ""
+
+
+def run_check_lane(lane: Sequence[tuple[list[str], str]]) -> dict[str, tuple[int, str, str]]:
+    """Run external checks one after another.
+
+    Args:
+        lane: Commands and descriptions to run in order
+
+    Returns:
+        Mapping of description to exit code, stdout, and stderr
+
+    """
+    return {description: run_external_check(cmd) for cmd, description in lane}
+
+
+def run_checks() -> list[tuple[str, int]]:
+    """Run all pre-release checks.
+
+    Returns:
+        List of (description, exit code) tuples in check order
+
+    """
+    external = [(cmd, description) for cmd, description in CHECKS if cmd is not None]
+    lanes = [[check] for check in external if check[1] not in SHARED_BUILD_DIR_CHECKS]
+    lanes.append([check for check in external if check[1] in SHARED_BUILD_DIR_CHECKS])
+
+    outcomes: dict[str, tuple[int, str, str]] = {}
+    with ThreadPoolExecutor(max_workers=len(lanes)) as executor:
+        for _, description in external:
+            logger.info("  Running %s...", description)
+        futures = [executor.submit(run_check_lane, lane) for lane in lanes]
+
+        for cmd, description in CHECKS:
+            if cmd is None:
+                logger.info("  Running %s...", description)
+                outcomes[description] = run_tests()
+
+        for future in as_completed(futures):
+            outcomes.update(future.result())
+
+    # Report in the original check order once everything has finished
+    results: list[tuple[str, int]] = []
+    for _, description in CHECKS:
+        exit_code, stdout, stderr = outcomes[description]
+        if exit_code != 0:
+            if stdout:
+                logger.error("  %s stdout: %s", description, stdout)
+            if stderr:
+                logger.error("  %s stderr: %s", description, stderr)
+        results.append((description, exit_code))
+
+    return results
+
+
+def main() -> None:
+    """Run the checks and exit non-zero if any failed."""
+    results = run_checks()
+
+    all_passed = True
+    for description, exit_code in results:
+        if exit_code == 0:
+            logger.info("  ✅ %s passed", description)
+        else:
+            logger.error("  ❌ %s failed", description)
+            all_passed = False
+
+    sys.exit(0 if all_passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,16 +5,24 @@ This script validates that the current Python environment is compatible
 with nwws-oi-receiver and provides detailed compatibility information.
 """
 
+import asyncio
+import functools
+import importlib.util
 import logging
 import platform
-import subprocess
+import shutil
+import struct
 import sys
+import typing
+from collections.abc import Callable
 from typing import NamedTuple
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(message)s")
+# The report is written directly to stdout; logging is only used for errors
 logger = logging.getLogger(__name__)
 
+# Interpreter version, captured once and reused by all checks
+_PYTHON_VERSION = sys.version_info[:2]
+
 
 class CompatibilityResult(NamedTuple):
     """Result of compatibility check."""
@@ -26,21 +34,26 @@ class CompatibilityResult(NamedTuple):
     features_available: dict[str, bool]
 
 
+@functools.cache
 def get_python_info() -> dict[str, str]:
     """Get comprehensive Python environment information.
 
+    Some platform lookups spawn subprocesses, so the result is computed once and
+    cached. The platform string is built from a single platform.uname() call and
+    the architecture is derived from the pointer size rather than
+    platform.architecture(), which may shell out to file(1).
+
     Returns:
         Dictionary containing Python environment details
 
     """
+    uname = platform.uname()
     return {
         "version": platform.python_version(),
         "version_info": f"{sys.version_info.major}.{sys.version_info.minor}.{sys.version_info.micro}",
         "implementation": platform.python_implementation(),
-        "compiler": platform.python_compiler(),
-        "build": platform.python_build()[0],
-        "platform": platform.platform(),
-        "architecture": platform.architecture()[0],
+        "platform": f"{uname.system}-{uname.release}-{uname.machine}",
+        "architecture": f"{struct.calcsize('P') * 8}bit",
         "executable": sys.executable,
     }
 
@@ -54,7 +67,7 @@ def check_minimum_version() -> tuple[bool, list[str]]:
     """
     issues: list[str] = []
     min_version = (3, 12)
-    current_version = (sys.version_info.major, sys.version_info.minor)
+    current_version = _PYTHON_VERSION
 
     if current_version < min_version:
         issues.append(
@@ -75,39 +88,23 @@ def check_language_features() -> dict[str, bool]:
     """
     features: dict[str, bool] = {}
 
-    # Test PEP 604: Union operator (Python 3.10+)
-    try:
-        exec("x: str | None = None")  # noqa: S102
-        features["union_operator"] = True
-    except SyntaxError:
-        features["union_operator"] = False
+    # PEP 604: Union operator (Python 3.10+)
+    features["union_operator"] = _PYTHON_VERSION >= (3, 10)
 
-    # Test PEP 585: Type Hinting Generics (Python 3.9+)
-    try:
-        exec("x: list[str] = []")  # noqa: S102
-        features["generic_types"] = True
-    except (SyntaxError, TypeError):
-        features["generic_types"] = False
+    # PEP 585: Type Hinting Generics (Python 3.9+)
+    features["generic_types"] = _PYTHON_VERSION >= (3, 9)
 
-    # Test Enhanced error messages (Python 3.11+)
-    features["enhanced_errors"] = sys.version_info >= (3, 11)
+    # Enhanced error messages (Python 3.11+)
+    features["enhanced_errors"] = _PYTHON_VERSION >= (3, 11)
 
-    # Test Performance improvements (Python 3.12+)
-    features["performance_optimizations"] = sys.version_info >= (3, 12)
+    # Performance improvements (Python 3.12+)
+    features["performance_optimizations"] = _PYTHON_VERSION >= (3, 12)
 
-    # Test asyncio improvements (Python 3.11+)
-    features["asyncio_improvements"] = sys.version_info >= (3, 11)
+    # asyncio improvements (Python 3.11+)
+    features["asyncio_improvements"] = _PYTHON_VERSION >= (3, 11)
 
-    # Test structural pattern matching (Python 3.10+)
-    try:
-        exec("""  # noqa: S102
-match 1:
-    case 1:
-        pass
-""")  # noqa: S102
-        features["pattern_matching"] = True
-    except SyntaxError:
-        features["pattern_matching"] = False
+    # PEP 634: Structural pattern matching (Python 3.10+)
+    features["pattern_matching"] = _PYTHON_VERSION >= (3, 10)
 
     return features
 
@@ -121,27 +118,9 @@ def check_typing_support() -> tuple[bool, list[str]]:
     """
     issues: list[str] = []
 
-    try:
-        # Test basic typing imports
-        import typing
-
-        # Check if advanced typing features are available
-        if not hasattr(typing, "get_origin"):
-            issues.append("Advanced typing introspection not available")
-
-        # Test dataclasses availability
-        import dataclasses
-
-        _ = dataclasses
-
-        # Test pathlib availability
-        from pathlib import Path
-
-        _ = Path
-
-    except ImportError as e:
-        issues.append(f"Missing typing support: {e}")
-        return False, issues
+    # Check if advanced typing features are available
+    if not hasattr(typing, "get_origin"):
+        issues.append("Advanced typing introspection not available")
 
     return True, issues
 
@@ -155,30 +134,13 @@ def check_async_support() -> tuple[bool, list[str]]:
     """
     issues: list[str] = []
 
-    try:
-        import asyncio
-
-        # Test async/await syntax
-        exec("""  # noqa: S102
-async def test_async():
-    await asyncio.sleep(0)
-""")  # noqa: S102
-
-        # Test asyncio.run (Python 3.7+)
-        if not hasattr(asyncio, "run"):
-            issues.append("asyncio.run() not available")
+    # Test asyncio.run (Python 3.7+)
+    if not hasattr(asyncio, "run"):
+        issues.append("asyncio.run() not available")
 
-        # Test TaskGroup (Python 3.11+)
-        try:
-            from asyncio import TaskGroup
-
-            _ = TaskGroup
-        except ImportError:
-            issues.append("asyncio.TaskGroup not available")
-
-    except (ImportError, SyntaxError) as e:
-        issues.append(f"Async support issue: {e}")
-        return False, issues
+    # Test TaskGroup (Python 3.11+), which also implies async/await syntax support
+    if not hasattr(asyncio, "TaskGroup"):
+        issues.append("asyncio.TaskGroup not available")
 
     return True, issues
 
@@ -198,44 +160,17 @@ def check_dependencies() -> tuple[bool, list[str]]:
 
         # If we can import it, check version compatibility
         version = getattr(nwws_oi_receiver, "__version__", "unknown")
-        logger.info("✅ nwws-oi-receiver %s is already installed and working", version)
+        sys.stdout.write(f"✅ nwws-oi-receiver {version} is already installed and working\n")
     except ImportError:
         # Not installed, which is fine for compatibility check
         pass
     except (ValueError, TypeError, AttributeError) as e:
         issues.append(f"nwws-oi-receiver import error: {e}")
 
-    # Check package manager compatibility (pip or uv)
-    has_package_manager = False
-
-    # Check for pip
-    try:
-        result = subprocess.run(  # noqa: S603
-            [sys.executable, "-m", "pip", "--version"],
-            capture_output=True,
-            check=False,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode == 0:
-            has_package_manager = True
-    except (FileNotFoundError, subprocess.TimeoutExpired):
-        pass
-
-    # Check for uv
-    if not has_package_manager:
-        try:
-            result = subprocess.run(  # noqa: S603
-                ["uv", "--version"],  # noqa: S607
-                capture_output=True,
-                check=False,
-                text=True,
-                timeout=10,
-            )
-            if result.returncode == 0:
-                has_package_manager = True
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            pass
+    # Check package manager compatibility (pip or uv) without spawning processes
+    has_package_manager = (
+        importlib.util.find_spec("pip") is not None or shutil.which("uv") is not None
+    )
 
     if not has_package_manager:
         issues.append("No package manager (pip or uv) available")
@@ -243,11 +178,16 @@ def check_dependencies() -> tuple[bool, list[str]]:
     return len(issues) == 0, issues
 
 
-def generate_recommendations(result: CompatibilityResult) -> list[str]:
+def generate_recommendations(
+    *,
+    is_compatible: bool,
+    features_available: dict[str, bool],
+) -> list[str]:
     """Generate recommendations based on compatibility check.
 
     Args:
-        result: Compatibility check result
+        is_compatible: Whether the environment passed the compatibility checks
+        features_available: Mapping of language feature names to availability
 
     Returns:
         List of recommendations
@@ -255,7 +195,7 @@ def generate_recommendations(result: CompatibilityResult) -> list[str]:
     """
     recommendations: list[str] = []
 
-    if not result.is_compatible:
+    if not is_compatible:
         recommendations.extend(
             [
                 "🔄 Upgrade to Python 3.12 or newer",
@@ -265,7 +205,7 @@ def generate_recommendations(result: CompatibilityResult) -> list[str]:
             ],
         )
     else:
-        current_version = sys.version_info[:2]
+        current_version = _PYTHON_VERSION
         if current_version == (3, 12):
             recommendations.append(
                 "✅ Great! Consider upgrading to Python 3.13 for better performance",
@@ -274,138 +214,146 @@ def generate_recommendations(result: CompatibilityResult) -> list[str]:
             recommendations.append("🚀 Excellent! You're using the latest Python version")
 
     # Feature-specific recommendations
-    if not result.features_available.get("union_operator", True):
+    if not features_available.get("union_operator", True):
         recommendations.append(
             "⚠️  Union operator (|) not available - upgrade for better type annotations",
         )
 
-    if not result.features_available.get("performance_optimizations", True):
+    if not features_available.get("performance_optimizations", True):
         recommendations.append("⚡ Upgrade to Python 3.12+ for 10-15% performance improvement")
 
     return recommendations
 
 
-def run_compatibility_check() -> CompatibilityResult:
+# Checks that determine overall compatibility, run in order
+_CHECKS: tuple[Callable[[], tuple[bool, list[str]]], ...] = (
+    check_minimum_version,
+    check_typing_support,
+    check_async_support,
+    check_dependencies,
+)
+
+
+def run_compatibility_check(python_info: dict[str, str]) -> CompatibilityResult:
     """Run comprehensive compatibility check.
 
+    Args:
+        python_info: Python environment information from get_python_info()
+
     Returns:
         Comprehensive compatibility result
 
     """
     all_issues: list[str] = []
+    is_compatible = True
 
-    # Check minimum version
-    version_ok, version_issues = check_minimum_version()
-    all_issues.extend(version_issues)
+    for check in _CHECKS:
+        check_ok, check_issues = check()
+        all_issues.extend(check_issues)
+        is_compatible = is_compatible and check_ok
 
     # Check language features
     features = check_language_features()
 
-    # Check typing support
-    typing_ok, typing_issues = check_typing_support()
-    all_issues.extend(typing_issues)
-
-    # Check async support
-    async_ok, async_issues = check_async_support()
-    all_issues.extend(async_issues)
-
-    # Check dependencies
-    deps_ok, deps_issues = check_dependencies()
-    all_issues.extend(deps_issues)
-
-    # Overall compatibility
-    is_compatible = version_ok and typing_ok and async_ok and deps_ok
+    # Generate recommendations
+    recommendations = generate_recommendations(
+        is_compatible=is_compatible,
+        features_available=features,
+    )
 
-    result = CompatibilityResult(
+    return CompatibilityResult(
         is_compatible=is_compatible,
-        python_version=platform.python_version(),
+        python_version=python_info["version"],
         issues=all_issues,
-        recommendations=[],
+        recommendations=recommendations,
         features_available=features,
     )
 
-    # Generate recommendations
-    return result._replace(recommendations=generate_recommendations(result))
-
 
-def print_detailed_report(result: CompatibilityResult) -> None:
+def print_detailed_report(result: CompatibilityResult, python_info: dict[str, str]) -> None:
     """Print detailed compatibility report.
 
+    The report is assembled in memory and written to stdout in a single call.
+
     Args:
         result: Compatibility check result
+        python_info: Python environment information from get_python_info()
 
     """
-    python_info = get_python_info()
-
-    logger.info("🐍 Python Compatibility Check for nwws-oi-receiver")
-    logger.info("=" * 60)
-
-    # Python environment info
-    logger.info("\n📋 Python Environment:")
-    logger.info("  Version: %s", python_info["version"])
-    logger.info("  Implementation: %s", python_info["implementation"])
-    logger.info("  Platform: %s", python_info["platform"])
-    logger.info("  Architecture: %s", python_info["architecture"])
-    logger.info("  Executable: %s", python_info["executable"])
-
-    # Compatibility status
-    logger.info("\n🎯 Compatibility Status:")
-    if result.is_compatible:
-        logger.info("  ✅ COMPATIBLE - nwws-oi-receiver will work with this Python version")
-    else:
-        logger.info("  ❌ INCOMPATIBLE - nwws-oi-receiver requires a newer Python version")
-
-    # Feature availability
-    logger.info("\n🔧 Language Features:")
+    lines = [
+        "🐍 Python Compatibility Check for nwws-oi-receiver",
+        "=" * 60,
+        # Python environment info
+        "\n📋 Python Environment:",
+        f"  Version: {python_info['version']}",
+        f"  Implementation: {python_info['implementation']}",
+        f"  Platform: {python_info['platform']}",
+        f"  Architecture: {python_info['architecture']}",
+        f"  Executable: {python_info['executable']}",
+        # Compatibility status
+        "\n🎯 Compatibility Status:",
+        "  ✅ COMPATIBLE - nwws-oi-receiver will work with this Python version"
+        if result.is_compatible
+        else "  ❌ INCOMPATIBLE - nwws-oi-receiver requires a newer Python version",
+        # Feature availability
+        "\n🔧 Language Features:",
+    ]
     for feature, available in result.features_available.items():
         status = "✅" if available else "❌"
         feature_name = feature.replace("_", " ").title()
-        logger.info("  %s %s", status, feature_name)
+        lines.append(f"  {status} {feature_name}")
 
     # Issues
     if result.issues:
-        logger.info("\n⚠️  Issues Found:")
-        for issue in result.issues:
-            logger.info("  • %s", issue)
+        lines.append("\n⚠️  Issues Found:")
+        lines.extend(f"  • {issue}" for issue in result.issues)
 
     # Recommendations
     if result.recommendations:
-        logger.info("\n💡 Recommendations:")
-        for rec in result.recommendations:
-            logger.info("  %s", rec)
+        lines.append("\n💡 Recommendations:")
+        lines.extend(f"  {rec}" for rec in result.recommendations)
 
     # Installation commands
     if not result.is_compatible:
-        logger.info("\n🔧 Upgrade Options:")
-        logger.info("  # Using pyenv:")
-        logger.info("  pyenv install 3.12.0")
-        logger.info("  pyenv local 3.12.0")
-        logger.info("")
-        logger.info("  # Using conda:")
-        logger.info("  conda create -n nwws-oi-receiver python=3.12")
-        logger.info("  conda activate nwws-oi-receiver")
-        logger.info("")
-        logger.info("  # Using Docker:")
-        logger.info("  docker run -it python:3.12-slim python")
+        lines.extend(
+            [
+                "\n🔧 Upgrade Options:",
+                "  # Using pyenv:",
+                "  pyenv install 3.12.0",
+                "  pyenv local 3.12.0",
+                "",
+                "  # Using conda:",
+                "  conda create -n nwws-oi-receiver python=3.12",
+                "  conda activate nwws-oi-receiver",
+                "",
+                "  # Using Docker:",
+                "  docker run -it python:3.12-slim python",
+            ],
+        )
+
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def main() -> None:
     """Execute compatibility checker."""
     try:
-        result = run_compatibility_check()
-        print_detailed_report(result)
+        python_info = get_python_info()
+        result = run_compatibility_check(python_info)
+        print_detailed_report(result, python_info)
 
         # Exit with appropriate code
         if result.is_compatible:
-            logger.info("\n🎉 Ready to install and use nwws-oi-receiver!")
+            sys.stdout.write("\n🎉 Ready to install and use nwws-oi-receiver!\n")
             sys.exit(0)
         else:
-            logger.info("\n❌ Please upgrade Python before using nwws-oi-receiver")
+            sys.stdout.write("\n❌ Please upgrade Python before using nwws-oi-receiver\n")
             sys.exit(1)
 
-    except (OSError, subprocess.SubprocessError):
-        logger.exception("\n💥 Error during compatibility check")
-        logger.info("This might indicate a Python environment issue.")
+    except OSError:
+        logger.exception(
+            "💥 Error during compatibility check, this might indicate a Python environment issue"
+        )
         sys.exit(2)
 
 
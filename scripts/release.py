@@ -14,7 +14,8 @@ import logging
 import re
 import subprocess
 import sys
-from collections.abc import Sequence
+import tomllib
+from collections.abc import Generator, Sequence
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import NamedTuple
@@ -23,6 +24,34 @@ from typing import NamedTuple
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
 
+# Patterns used on every release run, compiled once
+_VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:-(.+))?$")
+# pyproject.toml is ASCII, so its pattern works on raw bytes and skips decoding
+_PYPROJECT_VERSION_RE = re.compile(rb'^version = "([^"]+)"', re.MULTILINE)
+
+# Upper bound on commits listed in one changelog entry
+MAX_CHANGELOG_COMMITS = 1000
+
+# Files touched by a release, relative to the repository root
+_PYPROJECT = Path("pyproject.toml")
+_CHANGELOG = Path("CHANGELOG.md")
+
+# File contents read during this release run, kept in sync with what is written
+_file_cache: dict[Path, bytes] = {}
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read a file once per release run, returning the cached contents afterwards."""
+    if path not in _file_cache:
+        _file_cache[path] = path.read_bytes()
+    return _file_cache[path]
+
+
+def _write_bytes(path: Path, content: bytes) -> None:
+    """Write a file and update the cached contents."""
+    path.write_bytes(content)
+    _file_cache[path] = content
+
 
 class Version(NamedTuple):
     """Semantic version representation."""
@@ -46,8 +75,7 @@ class Version(NamedTuple):
             ValueError: If version format is invalid
 
         """
-        pattern = r"^(\d+)\.(\d+)\.(\d+)(?:-(.+))?$"
-        match = re.match(pattern, version_str)
+        match = _VERSION_RE.match(version_str)
         if not match:
             msg = f"Invalid version format: {version_str}"
             raise ValueError(msg)
@@ -125,6 +153,23 @@ def run_command(cmd: Sequence[str], *, check: bool = True) -> CommandResult:
         return CommandResult(1, "", "Command timed out")
 
 
+def run_command_fast(cmd: Sequence[str]) -> CommandResult:
+    """Run a quick local command without a timeout and return exit code, stdout, stderr.
+
+    For local git commands that finish in milliseconds and run no hooks, where
+    the timeout bookkeeping in run_command is not needed.
+
+    Args:
+        cmd: Command and arguments to run
+
+    Returns:
+        Command result with exit code, stdout, and stderr
+
+    """
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False)  # noqa: S603
+    return CommandResult(result.returncode, result.stdout.strip(), result.stderr.strip())
+
+
 def get_current_version() -> Version:
     """Get current version from pyproject.toml.
 
@@ -136,192 +181,274 @@ def get_current_version() -> Version:
         ValueError: If version not found in file
 
     """
-    pyproject_path = Path("pyproject.toml")
-    if not pyproject_path.exists():
+    try:
+        content = _read_bytes(_PYPROJECT)
+    except FileNotFoundError as e:
         msg = "pyproject.toml not found"
-        raise FileNotFoundError(msg)
+        raise FileNotFoundError(msg) from e
 
-    content = pyproject_path.read_text(encoding="utf-8")
-    match = re.search(r'version = "([^"]+)"', content)
-    if not match:
+    try:
+        version = tomllib.loads(content.decode())["project"]["version"]
+    except (tomllib.TOMLDecodeError, KeyError) as e:
         msg = "Version not found in pyproject.toml"
-        raise ValueError(msg)
+        raise ValueError(msg) from e
 
-    return Version.parse(match.group(1))
+    return Version.parse(version)
 
 
 def update_version_in_pyproject(new_version: Version) -> None:
     """Update version in pyproject.toml.
 
+    The line is rewritten with a regex to keep the file's formatting and comments,
+    after checking it holds the same version tomllib reads from [project].
+
     Args:
         new_version: New version to set
 
-    """
-    pyproject_path = Path("pyproject.toml")
-    content = pyproject_path.read_text(encoding="utf-8")
-
-    # Update version
-    new_content = re.sub(r'version = "[^"]+"', f'version = "{new_version}"', content)
-
-    pyproject_path.write_text(new_content, encoding="utf-8")
-    logger.info("✅ Updated pyproject.toml version to %s", new_version)
+    Raises:
+        ValueError: If the project version line cannot be found
 
+    """
+    content = _read_bytes(_PYPROJECT)
 
-def update_version_in_init(new_version: Version) -> None:
-    """Update version in __init__.py.
+    current_version = str(get_current_version())
+    match = _PYPROJECT_VERSION_RE.search(content)
+    if not match or match.group(1) != current_version.encode():
+        msg = f"Project version line for {current_version} not found in pyproject.toml"
+        raise ValueError(msg)
 
-    Args:
-        new_version: New version to set
+    # Update version
+    new_content = content[: match.start(1)] + str(new_version).encode() + content[match.end(1) :]
 
-    """
-    init_path = Path("nwws_oi_receiver/__init__.py")
-    if not init_path.exists():
+    # Leave the file untouched so its mtime does not invalidate build caches
+    if new_content == content:
         return
 
-    content = init_path.read_text(encoding="utf-8")
-    new_content = re.sub(r'__version__ = "[^"]+"', f'__version__ = "{new_version}"', content)
-
-    if new_content != content:
-        init_path.write_text(new_content, encoding="utf-8")
-        logger.info("✅ Updated __init__.py version to %s", new_version)
+    _write_bytes(_PYPROJECT, new_content)
+    logger.info("✅ Updated pyproject.toml version to %s", new_version)
 
 
 def run_pre_release_checks() -> bool:
     """Run comprehensive pre-release checks.
 
+    All checks run inside a single ``uv run`` process (scripts/_run_checks.py) so
+    the project environment is resolved once rather than once per check.
+
     Returns:
         True if all checks pass, False otherwise
 
     """
     logger.info("🔍 Running pre-release checks...")
 
-    checks = [
-        (["uv", "run", "ruff", "format", "--check"], "Code formatting"),
-        (["uv", "run", "ruff", "check"], "Linting"),
-        (["uv", "run", "basedpyright", "src/nwws_receiver"], "Type checking"),
-        (["uv", "run", "pytest"], "Tests"),
-        (["uv", "run", "python", "scripts/validate_typing.py"], "Typing validation"),
-        (["uv", "run", "python", "-m", "build"], "Build"),
-    ]
-
-    all_passed = True
-    for cmd, description in checks:
-        logger.info("  Running %s...", description)
-        result = run_command(cmd, check=False)
-
-        if result.exit_code == 0:
-            logger.info("  ✅ %s passed", description)
-        else:
-            logger.error("  ❌ %s failed", description)
-            if result.stdout:
-                logger.error("     stdout: %s", result.stdout)
-            if result.stderr:
-                logger.error("     stderr: %s", result.stderr)
-            all_passed = False
+    try:
+        # Output is not captured so check progress is shown as it happens
+        result = subprocess.run(  # noqa: S603
+            ["uv", "run", "python", "scripts/_run_checks.py"],  # noqa: S607
+            check=False,
+            timeout=900,  # 15 minute timeout for the whole batch
+        )
+    except subprocess.TimeoutExpired:
+        logger.exception("  ❌ Pre-release checks timed out")
+        return False
 
-    return all_passed
+    return result.returncode == 0
 
 
-def get_git_changes_since_tag(tag: str) -> list[str]:
-    """Get git commit messages since the specified tag.
+def _iter_git_lines(cmd: Sequence[str]) -> Generator[str, None, None]:
+    """Run a git command and yield its non-empty output lines as they arrive.
 
     Args:
-        tag: Git tag to compare from
+        cmd: Command and arguments to run
+
+    Yields:
+        Output lines with trailing whitespace removed
+
+    """
+    with subprocess.Popen(  # noqa: S603
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        bufsize=1,
+    ) as proc:
+        if proc.stdout is None:
+            return
+        yield from (line.rstrip() for line in proc.stdout if line.strip())
+
+
+class ChangesSinceTag(NamedTuple):
+    """Commit messages made since the most recent tag."""
+
+    tag: str | None
+    messages: list[str]
+    truncated: bool = False
+
+
+def _get_changes_since_latest_tag() -> ChangesSinceTag:
+    """Find the most recent tag and the commits made since it.
+
+    The commits are everything reachable from HEAD but not from the tag, so work
+    merged in from branches that forked before the tag is included.
 
     Returns:
-        List of commit messages since the tag
+        The latest tag and the non-merge commit subjects since it, newest first.
+        If no tag is found the tag is None and there are no messages.
 
     """
-    result = run_command(["git", "log", f"{tag}..HEAD", "--oneline", "--no-merges"], check=False)
+    describe = run_command_fast(["git", "describe", "--tags", "--abbrev=0"])
+    if describe.exit_code != 0 or not describe.stdout:
+        return ChangesSinceTag(None, [])
+    tag = describe.stdout
 
-    if result.exit_code != 0:
-        return []
+    lines = _iter_git_lines(["git", "log", f"{tag}..HEAD", "--no-merges", "--format=%s"])
+    messages: list[str] = []
+    try:
+        for subject in lines:
+            messages.append(subject)
+            if len(messages) >= MAX_CHANGELOG_COMMITS:
+                return ChangesSinceTag(tag, messages, truncated=True)
+    finally:
+        lines.close()  # Closes the pipe so git stops walking
+
+    return ChangesSinceTag(tag, messages)
+
+
+class GitClient:
+    """Git operations used during a release run.
+
+    Created once in main() and passed to the actions so every git query in a run
+    goes through a single object, which remembers the changes since the latest tag
+    until it creates a new tag.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the client with no git history read yet."""
+        self._changes: ChangesSinceTag | None = None
+
+    def changes_since_latest_tag(self) -> ChangesSinceTag:
+        """Get the most recent tag reachable from HEAD and the commits since it.
+
+        Returns:
+            The latest tag and up to MAX_CHANGELOG_COMMITS commit subjects since it
+
+        """
+        if self._changes is None:
+            self._changes = _get_changes_since_latest_tag()
+        return self._changes
+
+    def commit(self, paths: Sequence[str], message: str) -> CommandResult:
+        """Stage the given paths and commit them.
 
-    return [line.strip() for line in result.stdout.split("\n") if line.strip()]
+        Args:
+            paths: Files to stage
+            message: Commit message
+
+        Returns:
+            Result of the failing git command, or of the commit
 
+        """
+        add_result = run_command_fast(["git", "add", *paths])
+        if add_result.exit_code != 0:
+            return add_result
+        return run_command(["git", "commit", "-m", message], check=False)
+
+    def tag(self, name: str, message: str) -> CommandResult:
+        """Create an annotated tag at HEAD.
+
+        Args:
+            name: Tag name
+            message: Tag message
+
+        Returns:
+            Result of the git command
 
-def generate_changelog_entry(version: Version) -> str:
+        """
+        result = run_command_fast(["git", "tag", "-a", name, "-m", message])
+        self._changes = None
+        return result
+
+    def push_tag(self, name: str) -> CommandResult:
+        """Push a tag to origin.
+
+        Args:
+            name: Tag name
+
+        Returns:
+            Result of the git command
+
+        """
+        return run_command(["git", "push", "origin", name], check=False)
+
+
+def generate_changelog_entry(git: GitClient, version: Version) -> str:
     """Generate changelog entry for the new version.
 
     Args:
+        git: Git client for the release run
         version: Version to generate changelog for
 
     Returns:
         Formatted changelog entry
 
     """
-    # Get the latest tag
-    result = run_command(["git", "describe", "--tags", "--abbrev=0"], check=False)
-
-    if result.exit_code == 0 and result.stdout:
-        latest_tag = result.stdout.strip()
-        changes = get_git_changes_since_tag(latest_tag)
-    else:
-        changes = []
+    changes = git.changes_since_latest_tag()
+    if changes.truncated:
+        logger.warning("Truncated at %d commits since the latest tag", MAX_CHANGELOG_COMMITS)
+    items = [f"- {message}\n" for message in changes.messages]
 
     # Generate changelog entry
     date_str = datetime.now(UTC).strftime("%Y-%m-%d")
-    entry = f"\n## [{version}] - {date_str}\n\n"
-
-    if changes:
-        entry += "### Changes\n\n"
-        for change in changes:
-            # Clean up commit message
-            clean_change = re.sub(r"^[a-f0-9]+\s+", "", change)
-            entry += f"- {clean_change}\n"
-    else:
-        entry += "### Changes\n\n- Initial release\n"
+    entry = f"\n## [{version}] - {date_str}\n\n### Changes\n\n"
+    entry += "".join(items) if items else "- Initial release\n"
 
     return entry
 
 
-def update_changelog(version: Version) -> None:
+def update_changelog(git: GitClient, version: Version) -> None:
     """Update CHANGELOG.md with new version entry.
 
     Args:
+        git: Git client for the release run
         version: Version to add to changelog
 
     """
-    changelog_path = Path("CHANGELOG.md")
-
-    if not changelog_path.exists():
+    try:
+        content = _read_bytes(_CHANGELOG).decode("utf-8")
+    except FileNotFoundError:
         # Create new changelog
         content = (
             "# Changelog\n\n"
             "All notable changes to this project will be documented in this file.\n\n"
             "The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/).\n"
         )
-    else:
-        content = changelog_path.read_text(encoding="utf-8")
 
     # Generate new entry
-    new_entry = generate_changelog_entry(version)
+    new_entry = generate_changelog_entry(git, version)
 
-    # Insert after the header
-    lines = content.split("\n")
-    insert_index = 3  # After header lines
-    for i, line in enumerate(lines):
-        if line.startswith("## ["):
-            insert_index = i
-            break
-
-    lines.insert(insert_index, new_entry.rstrip())
+    # Insert before the most recent release, or after the header if there is none
+    if content.startswith("## ["):
+        new_content = new_entry.lstrip() + "\n" + content
+    elif (idx := content.find("\n## [")) != -1:
+        new_content = content[:idx] + new_entry.rstrip() + "\n" + content[idx:]
+    else:
+        new_content = content.rstrip() + "\n" + new_entry
 
-    changelog_path.write_text("\n".join(lines), encoding="utf-8")
+    _write_bytes(_CHANGELOG, new_content.encode("utf-8"))
     logger.info("✅ Updated CHANGELOG.md with version %s", version)
 
 
-def create_git_tag(version: Version) -> None:
+def create_git_tag(git: GitClient, version: Version) -> None:
     """Create and push git tag for the release.
 
     Args:
+        git: Git client for the release run
         version: Version to tag
 
     """
     tag_name = f"v{version}"
 
     # Create tag
-    result = run_command(["git", "tag", "-a", tag_name, "-m", f"Release {version}"], check=False)
+    result = git.tag(tag_name, f"Release {version}")
 
     if result.exit_code != 0:
         logger.error("❌ Failed to create tag: %s", result.stderr)
@@ -332,7 +459,7 @@ def create_git_tag(version: Version) -> None:
     # Ask if we should push
     response = input(f"Push tag {tag_name} to origin? [y/N]: ")
     if response.lower() in ("y", "yes"):
-        push_result = run_command(["git", "push", "origin", tag_name], check=False)
+        push_result = git.push_tag(tag_name)
 
         if push_result.exit_code == 0:
             logger.info("✅ Pushed tag %s to origin", tag_name)
@@ -351,10 +478,11 @@ def handle_check_action() -> None:
         sys.exit(1)
 
 
-def handle_bump_action(args: argparse.Namespace, current_version: Version) -> None:
+def handle_bump_action(git: GitClient, args: argparse.Namespace, current_version: Version) -> None:
     """Handle the bump action.
 
     Args:
+        git: Git client for the release run
         args: Parsed command line arguments
         current_version: Current version
 
@@ -370,36 +498,25 @@ def handle_bump_action(args: argparse.Namespace, current_version: Version) -> No
         logger.info("🔍 Dry run - no changes made")
         return
 
-    # Update version files
+    # Update version; the package reads __version__ from the installed metadata
     update_version_in_pyproject(new_version)
-    update_version_in_init(new_version)
 
     # Commit changes
-    add_result = run_command(
-        ["git", "add", "pyproject.toml", "nwws_oi_receiver/__init__.py"],
-        check=False,
+    commit_result = git.commit(
+        [str(_PYPROJECT)],
+        f"bump: version {current_version} → {new_version}",
     )
-
-    if add_result.exit_code == 0:
-        commit_result = run_command(
-            [
-                "git",
-                "commit",
-                "-m",
-                f"bump: version {current_version} → {new_version}",
-            ],
-            check=False,
-        )
-        if commit_result.exit_code == 0:
-            logger.info("✅ Committed version bump")
-        else:
-            logger.error("❌ Failed to commit: %s", commit_result.stderr)
+    if commit_result.exit_code == 0:
+        logger.info("✅ Committed version bump")
+    else:
+        logger.error("❌ Failed to commit: %s", commit_result.stderr)
 
 
-def handle_release_action(args: argparse.Namespace) -> None:
+def handle_release_action(git: GitClient, args: argparse.Namespace) -> None:
     """Handle the release action.
 
     Args:
+        git: Git client for the release run
         args: Parsed command line arguments
 
     """
@@ -421,28 +538,18 @@ def handle_release_action(args: argparse.Namespace) -> None:
 
     # Update version
     update_version_in_pyproject(new_version)
-    update_version_in_init(new_version)
 
     # Update changelog
-    update_changelog(new_version)
+    update_changelog(git, new_version)
 
     # Commit changes
-    files_to_commit = [
-        "pyproject.toml",
-        "nwws_oi_receiver/__init__.py",
-        "CHANGELOG.md",
-    ]
-    add_result = run_command(["git", "add", *files_to_commit], check=False)
-    if add_result.exit_code == 0:
-        commit_result = run_command(
-            ["git", "commit", "-m", f"release: version {new_version}"],
-            check=False,
-        )
-        if commit_result.exit_code == 0:
-            logger.info("✅ Committed release changes")
+    files_to_commit = [str(_PYPROJECT), str(_CHANGELOG)]
+    commit_result = git.commit(files_to_commit, f"release: version {new_version}")
+    if commit_result.exit_code == 0:
+        logger.info("✅ Committed release changes")
 
     # Create tag
-    create_git_tag(new_version)
+    create_git_tag(git, new_version)
 
     logger.info("\n🎉 Release %s completed!", new_version)
     logger.info("   Tag created: v%s", new_version)
@@ -467,6 +574,7 @@ def main() -> None:
     parser.add_argument("--skip-checks", action="store_true", help="Skip pre-release checks")
 
     args = parser.parse_args()
+    git = GitClient()
 
     try:
         current_version = get_current_version()
@@ -475,9 +583,9 @@ def main() -> None:
         if args.action == "check":
             handle_check_action()
         elif args.action == "bump":
-            handle_bump_action(args, current_version)
+            handle_bump_action(git, args, current_version)
         elif args.action == "release":
-            handle_release_action(args)
+            handle_release_action(git, args)
 
     except (FileNotFoundError, ValueError, subprocess.SubprocessError):
         logger.exception("❌ Error occurred")
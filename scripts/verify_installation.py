@@ -10,23 +10,133 @@ Usage:
     python scripts/verify_installation.py
     # or
     python -m scripts.verify_installation
+    python scripts/verify_installation.py --parallel  # run the tests concurrently
 """
 
+import argparse
 import sys
-import traceback
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from nwws_receiver import WxWire
+
+# Interpreter version checks, evaluated once at import
+_PY_VERSION = sys.version_info[:2]
+_PY_LABEL = "{}.{}".format(*_PY_VERSION)
+_PY_MINIMUM = _PY_VERSION >= (3, 0)
+_PY_SUPPORTED = _PY_VERSION >= (3, 12)
+
+# Names the package must export
+_EXPECTED_EXPORTS: frozenset[str] = frozenset(
+    {
+        "WxWire",
+        "WxWireConfig",
+        "NoaaPortMessage",
+        "MessageHandler",
+        "ConfigurationError",
+    }
+)
+
+
+class Log:
+    """Collect output lines and write them to stdout in one call per flush."""
+
+    def __init__(self, *, flush_on_error: bool = True) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            flush_on_error: Flush queued lines before writing an error, so it follows
+                the output that led up to it. Disabled for logs of concurrent tests,
+                whose output must stay in test order.
+
+        """
+        self.buf: list[str] = []
+        self.flush_on_error = flush_on_error
+
+    def __call__(self, msg: str) -> None:
+        """Queue a line of output."""
+        self.buf.append(msg)
+
+    def error(self, msg: str) -> None:
+        """Write an error and the current traceback to stderr right away."""
+        import traceback  # Only needed on failure, so kept off the startup path
+
+        if self.flush_on_error:
+            self.flush()
+        print(msg, file=sys.stderr)
+        traceback.print_exc()
+
+    def flush(self) -> None:
+        """Write all queued lines to stdout."""
+        if self.buf:
+            sys.stdout.write("\n".join(self.buf) + "\n")
+            sys.stdout.flush()
+            self.buf.clear()
+
+
+class _SharedClient:
+    """WxWire client built once on first use, safe to request from several threads."""
+
+    def __init__(self) -> None:
+        """Initialize without building the client."""
+        self._client: WxWire | None = None
+        self._lock = threading.Lock()
+
+    def get(self) -> "WxWire":
+        """Return the client, building it on the first call (it is never connected)."""
+        with self._lock:
+            if self._client is None:
+                from nwws_receiver import WxWire, WxWireConfig
+
+                self._client = WxWire(WxWireConfig(username="testuser", password="testpass"))
+            return self._client
+
 
+class Context:
+    """State shared by the verification tests."""
 
-def test_basic_imports() -> bool:
+    def __init__(self, log: Log, shared_client: _SharedClient | None = None) -> None:
+        """Initialize the context with the output log and an optional shared client."""
+        self.log = log
+        self._shared_client = shared_client or _SharedClient()
+
+    @property
+    def client(self) -> "WxWire":
+        """Client shared by the tests; built by the first test that needs it."""
+        return self._shared_client.get()
+
+    def with_log(self, log: Log) -> "Context":
+        """Return a context writing to another log but sharing this context's client."""
+        return Context(log, self._shared_client)
+
+
+def test_basic_imports(ctx: Context) -> bool:
     """Test basic package imports."""
-    print("🔍 Testing basic imports...")
+    log = ctx.log
+    log("🔍 Testing basic imports...")
 
     try:
-        # Test main package import
+        from importlib.util import find_spec
+
+        # Locating the modules is enough to show they are installed
+        for module in (
+            "nwws_receiver",
+            "nwws_receiver.config",
+            "nwws_receiver.message",
+            "nwws_receiver.wx_wire",
+        ):
+            if find_spec(module) is None:
+                log(f"❌ Missing module: {module}")
+                return False
+        log("✅ Package modules found")
+
+        # One full import catches errors that only surface when the code runs,
+        # such as a broken slixmpp dependency
         import nwws_receiver
-
-        print(f"✅ Package import successful: nwws_receiver v{nwws_receiver.__version__}")
-
-        # Test main classes
         from nwws_receiver import (
             WxWire,
             WxWireConfig,
@@ -34,59 +144,44 @@ def test_basic_imports() -> bool:
             MessageHandler,
         )
 
-        print("✅ Core classes imported successfully")
-
-        # Test config module
-        from nwws_receiver.config import ConfigurationError
-
-        print("✅ Config module imported successfully")
-
-        # Test message module
-        from nwws_receiver.message import NoaaPortMessage
-
-        print("✅ Message module imported successfully")
+        log(f"✅ Package import successful: nwws_receiver v{nwws_receiver.__version__}")
+        log("✅ Core classes imported successfully")
 
         return True
 
     except ImportError as e:
-        print(f"❌ Import failed: {e}")
-        traceback.print_exc()
+        log.error(f"❌ Import failed: {e}")
         return False
     except Exception as e:
-        print(f"❌ Unexpected error during import: {e}")
-        traceback.print_exc()
+        log.error(f"❌ Unexpected error during import: {e}")
         return False
 
 
-def test_class_instantiation() -> bool:
+def test_class_instantiation(ctx: Context) -> bool:
     """Test basic class instantiation."""
-    print("\n🏗️  Testing class instantiation...")
+    log = ctx.log
+    log("\n🏗️  Testing class instantiation...")
 
     try:
-        from nwws_receiver import WxWire, WxWireConfig
-
-        # Test config creation
-        config = WxWireConfig(username="testuser", password="testpass")
-        print(f"✅ WxWireConfig created: {config.username}")
-
-        # Test client creation (don't connect)
-        client = WxWire(config)
-        print("✅ WxWire client created successfully")
+        # Test config and client creation (don't connect)
+        client = ctx.client
+        log(f"✅ WxWireConfig created: {client.config.username}")
+        log("✅ WxWire client created successfully")
 
         # Test configuration access
-        print(f"✅ Configuration accessed: {client.config.username}")
+        log(f"✅ Configuration accessed: {client.config.username}")
 
         return True
 
     except Exception as e:
-        print(f"❌ Class instantiation failed: {e}")
-        traceback.print_exc()
+        log.error(f"❌ Class instantiation failed: {e}")
         return False
 
 
-def test_data_structures() -> bool:
+def test_data_structures(ctx: Context) -> bool:
     """Test data structure creation."""
-    print("\n📊 Testing data structures...")
+    log = ctx.log
+    log("\n📊 Testing data structures...")
 
     try:
         from datetime import UTC, datetime
@@ -104,7 +199,7 @@ def test_data_structures() -> bool:
             cccc="KWBC",
             awipsid="TEST123",
         )
-        print(f"✅ NoaaPortMessage created: {message.awipsid} ({message.ttaaii})")
+        log(f"✅ NoaaPortMessage created: {message.awipsid} ({message.ttaaii})")
 
         # Test WxWireConfig with validation
         config = WxWireConfig(
@@ -113,28 +208,28 @@ def test_data_structures() -> bool:
             server="nwws-oi.weather.gov",
             port=5222,
         )
-        print(f"✅ WxWireConfig created: {config.username}@{config.server}:{config.port}")
+        log(f"✅ WxWireConfig created: {config.username}@{config.server}:{config.port}")
 
         # Test ConfigurationError with invalid port
         try:
             WxWireConfig(username="testuser", password="test", port=99999)
         except ConfigurationError:
-            print("✅ ConfigurationError properly raised for invalid port")
+            log("✅ ConfigurationError properly raised for invalid port")
         else:
-            print("❌ ConfigurationError should have been raised")
+            log("❌ ConfigurationError should have been raised")
             return False
 
         return True
 
     except Exception as e:
-        print(f"❌ Data structure test failed: {e}")
-        traceback.print_exc()
+        log.error(f"❌ Data structure test failed: {e}")
         return False
 
 
-def test_utilities() -> bool:
+def test_utilities(ctx: Context) -> bool:
     """Test utility functions."""
-    print("\n🔧 Testing utilities...")
+    log = ctx.log
+    log("\n🔧 Testing utilities...")
 
     try:
         from nwws_receiver.config import _validate_email, _validate_port
@@ -142,157 +237,135 @@ def test_utilities() -> bool:
 
         # Test email validation
         valid_email = _validate_email("test@weather.gov")
-        print(f"✅ Email validation working: {valid_email}")
+        log(f"✅ Email validation working: {valid_email}")
 
         # Test port validation
         valid_port = _validate_port(5222)
-        print(f"✅ Port validation working: {valid_port}")
+        log(f"✅ Port validation working: {valid_port}")
 
         # Test validation errors
         try:
             _validate_email("")
         except Exception:
-            print("✅ Email validation properly rejects empty email")
+            log("✅ Email validation properly rejects empty email")
         else:
-            print("❌ Email validation should have failed")
+            log("❌ Email validation should have failed")
             return False
 
         # Test message parsing capability
         sample_xml = "<message>Test weather content</message>"
         if hasattr(NoaaPortMessage, "from_xml"):
-            print("✅ Message parsing methods available")
+            log("✅ Message parsing methods available")
         else:
-            print("✅ NoaaPortMessage structure verified")
+            log("✅ NoaaPortMessage structure verified")
 
         return True
 
     except Exception as e:
-        print(f"❌ Utilities test failed: {e}")
-        traceback.print_exc()
+        log.error(f"❌ Utilities test failed: {e}")
         return False
 
 
-def test_async_features() -> bool:
+def test_async_features(ctx: Context) -> bool:
     """Test async feature availability."""
-    print("\n⚡ Testing async features...")
+    log = ctx.log
+    log("\n⚡ Testing async features...")
 
     try:
-        from nwws_receiver import WxWire, WxWireConfig
-
-        # Test async context manager availability
-        config = WxWireConfig(username="testuser", password="testpass")
-        client = WxWire(config)
-
-        # Check if async methods exist
-        if hasattr(client, "start") and callable(client.start):
-            print("✅ Async start method available")
-        else:
-            print("❌ Async start method missing")
-            return False
-
-        if hasattr(client, "stop") and callable(client.stop):
-            print("✅ Async stop method available")
-        else:
-            print("❌ Async stop method missing")
-            return False
-
-        if hasattr(client, "__aiter__") and callable(client.__aiter__):
-            print("✅ Async iterator (__aiter__) available")
-        else:
-            print("❌ Async iterator (__aiter__) missing")
-            return False
+        client = ctx.client
 
-        if hasattr(client, "__anext__") and callable(client.__anext__):
-            print("✅ Async iterator (__anext__) available")
-        else:
-            print("❌ Async iterator (__anext__) missing")
-            return False
-
-        # Test subscriber pattern
-        if hasattr(client, "subscribe") and callable(client.subscribe):
-            print("✅ Subscribe method available")
-        else:
-            print("❌ Subscribe method missing")
-            return False
-
-        if hasattr(client, "unsubscribe") and callable(client.unsubscribe):
-            print("✅ Unsubscribe method available")
-        else:
-            print("❌ Unsubscribe method missing")
+        # Check that the async lifecycle, iterator and subscriber methods exist
+        required = ("start", "stop", "__aiter__", "__anext__", "subscribe", "unsubscribe")
+        missing = [name for name in required if not callable(getattr(client, name, None))]
+        if missing:
+            log(f"❌ Missing async methods: {missing}")
             return False
+        log(f"✅ Async methods available: {', '.join(required)}")
 
         return True
 
     except Exception as e:
-        print(f"❌ Async features test failed: {e}")
-        traceback.print_exc()
+        log.error(f"❌ Async features test failed: {e}")
         return False
 
 
-def test_version_info() -> bool:
+def test_version_info(ctx: Context) -> bool:
     """Test version and metadata information."""
-    print("\n📋 Testing version and metadata...")
+    log = ctx.log
+    log("\n📋 Testing version and metadata...")
 
     try:
         import nwws_receiver
 
         # Check version
         version = getattr(nwws_receiver, "__version__", "unknown")
-        print(f"✅ Version: {version}")
+        log(f"✅ Version: {version}")
 
         # Check __all__ exports
-        all_exports = getattr(nwws_receiver, "__all__", [])
-        print(f"✅ Exported symbols: {len(all_exports)} items")
+        try:
+            all_exports = nwws_receiver.__all__
+        except AttributeError:
+            all_exports = ()
+        log(f"✅ Exported symbols: {len(all_exports)} items")
         for export in all_exports:
-            print(f"   - {export}")
+            log(f"   - {export}")
 
         # Verify key exports are present
-        expected_exports = {
-            "WxWire",
-            "WxWireConfig",
-            "NoaaPortMessage",
-            "MessageHandler",
-            "ConfigurationError",
-        }
-        missing = expected_exports - set(all_exports)
+        missing = _EXPECTED_EXPORTS.difference(all_exports)
         if missing:
-            print(f"❌ Missing expected exports: {missing}")
+            log(f"❌ Missing expected exports: {missing}")
             return False
         else:
-            print("✅ All expected exports present")
+            log("✅ All expected exports present")
 
         return True
 
     except Exception as e:
-        print(f"❌ Version info test failed: {e}")
-        traceback.print_exc()
+        log.error(f"❌ Version info test failed: {e}")
         return False
 
 
-def check_python_version() -> bool:
+def check_python_version(ctx: Context) -> bool:
     """Check Python version compatibility."""
-    print("🐍 Checking Python version...")
+    log = ctx.log
+    log("🐍 Checking Python version...")
 
-    major, minor = sys.version_info[:2]
-
-    if major < 3:
-        print(f"❌ Python {major}.{minor} is not supported. Python 3.12+ required.")
+    if not _PY_MINIMUM:
+        log(f"❌ Python {_PY_LABEL} is not supported. Python 3.12+ required.")
         return False
-    if major == 3 and minor < 12:
-        print(f"⚠️  Python {major}.{minor} detected. Python 3.12+ recommended.")
-        print("   Some features may not work correctly.")
+    if not _PY_SUPPORTED:
+        log(f"⚠️  Python {_PY_LABEL} detected. Python 3.12+ recommended.")
+        log("   Some features may not work correctly.")
         return True
-    print(f"✅ Python {major}.{minor} detected. Version compatible.")
+    log(f"✅ Python {_PY_LABEL} detected. Version compatible.")
     return True
 
 
+def run_test(test_name: str, test_func: "Callable[[Context], bool]", ctx: Context) -> bool:
+    """Run one verification test, treating an unexpected exception as a failure."""
+    try:
+        return test_func(ctx)
+    except Exception as e:
+        ctx.log.error(f"❌ {test_name} test crashed: {e}")
+        return False
+
+
 def main() -> int:
     """Run all verification tests."""
-    print("🚀 NWWS-OI Receiver Installation Verification")
-    print("=" * 55)
-
-    tests = [
-        ("Python Version", check_python_version),
+    parser = argparse.ArgumentParser(description="Verify the nwws-oi-receiver installation")
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Run the tests concurrently; output is still shown in test order",
+    )
+    args = parser.parse_args()
+
+    log = Log()
+    ctx = Context(log)
+    log("🚀 NWWS-OI Receiver Installation Verification")
+    log("=" * 55)
+
+    tests: list[tuple[str, Callable[[Context], bool]]] = [
         ("Basic Imports", test_basic_imports),
         ("Class Instantiation", test_class_instantiation),
         ("Data Structures", test_data_structures),
@@ -301,34 +374,46 @@ def main() -> int:
         ("Version Info", test_version_info),
     ]
 
-    passed = 0
-    failed = 0
-
-    for test_name, test_func in tests:
-        try:
-            if test_func():
-                passed += 1
-            else:
-                failed += 1
-        except Exception as e:
-            print(f"❌ {test_name} test crashed: {e}")
-            failed += 1
-
-    print("\n" + "=" * 55)
-    print(f"📊 Test Results: {passed} passed, {failed} failed")
+    # The Python version check always runs first, on its own
+    results = [run_test("Python Version", check_python_version, ctx)]
+    log.flush()
+
+    if args.parallel:
+        # Each test writes to its own log, flushed in test order once all finish
+        logs = [Log(flush_on_error=False) for _ in tests]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(run_test, name, func, ctx.with_log(test_log))
+                for (name, func), test_log in zip(tests, logs, strict=True)
+            ]
+            results.extend(future.result() for future in futures)
+        for test_log in logs:
+            test_log.flush()
+    else:
+        for test_name, test_func in tests:
+            results.append(run_test(test_name, test_func, ctx))
+            log.flush()
+
+    passed = sum(results)
+    failed = len(results) - passed
+
+    log("\n" + "=" * 55)
+    log(f"📊 Test Results: {passed} passed, {failed} failed")
 
     if failed == 0:
-        print("🎉 All tests passed! NWWS-OI Receiver is installed correctly.")
-        print("\n📚 Next steps:")
-        print("   - Run examples: python examples/usage_patterns.py")
-        print("   - Read documentation: README.md")
-        print("   - Connect to NWWS-OI: Set up your credentials and start receiving weather data")
+        log("🎉 All tests passed! NWWS-OI Receiver is installed correctly.")
+        log("\n📚 Next steps:")
+        log("   - Run examples: python examples/usage_patterns.py")
+        log("   - Read documentation: README.md")
+        log("   - Connect to NWWS-OI: Set up your credentials and start receiving weather data")
+        log.flush()
         return 0
-    print("❌ Some tests failed. Check the error messages above.")
-    print("\n🔧 Troubleshooting:")
-    print("   - Ensure Python 3.12+ is installed")
-    print("   - Try reinstalling: pip install --force-reinstall nwws-oi-receiver")
-    print("   - Check for dependency conflicts (slixmpp, etc.)")
+    log("❌ Some tests failed. Check the error messages above.")
+    log("\n🔧 Troubleshooting:")
+    log("   - Ensure Python 3.12+ is installed")
+    log("   - Try reinstalling: pip install --force-reinstall nwws-oi-receiver")
+    log("   - Check for dependency conflicts (slixmpp, etc.)")
+    log.flush()
     return 1
 
 
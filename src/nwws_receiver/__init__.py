@@ -1,10 +1,15 @@
 """XMPP client package for NWWS-OI."""
 
+from typing import TYPE_CHECKING, Any
+
 from .config import ConfigurationError, WxWireConfig
 from .message import NoaaPortMessage
-from .wx_wire import MessageHandler, WxWire
 
-__version__ = "1.0.0"
+if TYPE_CHECKING:
+    from .wx_wire import MessageHandler, WxWire
+
+# Resolved from the installed package metadata on first access
+__version__: str
 
 __all__ = [
     "ConfigurationError",
@@ -14,3 +19,34 @@ __all__ = [
     "WxWireConfig",
     "__version__",
 ]
+
+# The client module imports slixmpp, so it is only loaded on first access (PEP 562)
+_WX_WIRE_EXPORTS = frozenset({"MessageHandler", "WxWire"})
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve client attributes and the version on first access and cache them."""
+    if name in _WX_WIRE_EXPORTS:
+        from . import wx_wire  # noqa: PLC0415
+
+        value = getattr(wx_wire, name)
+        globals()[name] = value
+        return value
+
+    if name == "__version__":
+        from importlib.metadata import PackageNotFoundError, version  # noqa: PLC0415
+
+        try:
+            package_version = version("nwws-oi-receiver")
+        except PackageNotFoundError:
+            package_version = "0.0.0+unknown"
+        globals()[name] = package_version
+        return package_version
+
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+def __dir__() -> list[str]:
+    """List the module attributes together with the lazily imported public names."""
+    return sorted({*globals(), *__all__})
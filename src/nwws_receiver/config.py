@@ -6,6 +6,8 @@ from dataclasses import dataclass, field
 class ConfigurationError(ValueError):
     """Raised when configuration validation fails."""
 
+    __slots__ = ()
+
 
 def _validate_port(port: int, field_name: str = "port") -> int:
     """Validate port number.
@@ -18,9 +20,12 @@ def _validate_port(port: int, field_name: str = "port") -> int:
         Validated port number
 
     Raises:
-        ConfigurationError: If port is out of valid range
+        ConfigurationError: If port is not an integer or is out of valid range
 
     """
+    if not isinstance(port, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+        msg = f"{field_name.capitalize()} must be an integer, got {port!r}"
+        raise ConfigurationError(msg)
     if not (1 <= port <= 65535):
         msg = f"{field_name.capitalize()} must be between 1 and 65535, got {port}"
         raise ConfigurationError(msg)
@@ -38,16 +43,19 @@ def _validate_history(history: int, field_name: str = "history") -> int:
         Validated history value
 
     Raises:
-        ConfigurationError: If history is negative
+        ConfigurationError: If history is not an integer or is negative
 
     """
+    if not isinstance(history, int):  # pyright: ignore[reportUnnecessaryIsInstance]
+        msg = f"{field_name.capitalize()} must be an integer, got {history!r}"
+        raise ConfigurationError(msg)
     if history < 0:
         msg = f"{field_name.capitalize()} must be non-negative, got {history}"
         raise ConfigurationError(msg)
     return history
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WxWireConfig:
     """Configuration for Weather Wire module.
 
@@ -79,19 +87,17 @@ class WxWireConfig:
 
     def __post_init__(self) -> None:
         """Validate configuration after initialization."""
-        if self.username:
-            object.__setattr__(self, "username", self.username.strip())
-        if self.password:
-            object.__setattr__(self, "password", self.password.strip())
-
-        server = self.server.strip() if self.server else ""
-        if not server:
-            server = "nwws-oi.weather.gov"
-        object.__setattr__(self, "server", server)
-
-        # Validate port and history
-        validated_port = _validate_port(self.port, "port")
-        object.__setattr__(self, "port", validated_port)
-
-        validated_history = _validate_history(self.history, "history")
-        object.__setattr__(self, "history", validated_history)
+        # Validate port and history; valid values are returned unchanged
+        _validate_port(self.port)
+        _validate_history(self.history)
+
+        # Normalize string fields, only assigning values that actually change
+        username = self.username.strip()
+        if username != self.username:
+            object.__setattr__(self, "username", username)
+        password = self.password.strip()
+        if password != self.password:
+            object.__setattr__(self, "password", password)
+        server = self.server.strip() or "nwws-oi.weather.gov"
+        if server != self.server:
+            object.__setattr__(self, "server", server)
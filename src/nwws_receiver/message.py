@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NoaaPortMessage:
     """Represents a structured weather message received from the NWWS-OI system.
 
@@ -19,6 +19,9 @@ class NoaaPortMessage:
     by weather data consumers. Delay stamps are preserved to track message latency
     through the distribution system.
 
+    One instance is created per received product, so the class uses __slots__ to
+    avoid a per-instance __dict__, reducing memory use and attribute access cost.
+
     Attributes:
         subject: Subject of the message.
         noaaport: NOAAPort formatted text of the product message.
@@ -2,10 +2,12 @@
 """NWWS-OI XMPP client implementation using slixmpp."""
 
 import asyncio
+import inspect
 import logging
 import time
-from collections.abc import AsyncIterator, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 from xml.etree import ElementTree as ET
 
@@ -23,6 +25,11 @@ logger = logging.getLogger(__name__)
 MUC_ROOM = "nwws@conference.nwws-oi.weather.gov"
 IDLE_TIMEOUT = 90  # 90 seconds of inactivity before reconnecting
 MAX_HISTORY = 25  # Maximum history messages to retrieve when joining MUC
+MAX_SUBSCRIBER_TASKS = 64  # Maximum concurrently running async subscriber handlers
+AWIPS_ID_MAX_LENGTH = 6  # Maximum AWIPS ID (NNNxxx) length usable as a subscriber prefix
+
+# Bare JID of the MUC room, parsed once rather than for every incoming message
+_MUC_ROOM_BARE = JID(MUC_ROOM).bare
 
 # Type aliases
 MessageHandler = Callable[[NoaaPortMessage], Any]
@@ -113,8 +120,16 @@ class WxWire(slixmpp.ClientXMPP):
         self._message_queue: asyncio.Queue[NoaaPortMessage] = asyncio.Queue(maxsize=50)
         self._stop_iteration = False
 
-        # Subscriber management for callback pattern
-        self._subscribers: set[MessageHandler] = set()
+        # Subscriber management for callback pattern, mapping each handler to its
+        # AWIPS prefix filter (None receives all messages)
+        self._subscribers: dict[MessageHandler, frozenset[str] | None] = {}
+        self._unfiltered_subscribers: tuple[MessageHandler, ...] = ()
+        self._subscribers_by_prefix: dict[str, tuple[MessageHandler, ...]] = {}
+        self._subscriber_prefix_lengths: tuple[int, ...] = ()
+
+        # Bounded execution of async subscriber handlers
+        self._subscriber_tasks: set[asyncio.Task[None]] = set()
+        self._dropped_subscriber_calls = 0
 
         # Register plugins
         self.register_plugin("xep_0030")  # Service Discovery  # type: ignore[misc]
@@ -132,6 +147,9 @@ class WxWire(slixmpp.ClientXMPP):
         self._stats_update_task: asyncio.Task[None] | None = None
         self._background_tasks: list[asyncio.Task[None]] = []
         self._connection_start_time: float | None = None
+        # Set while no connection is up, cleared by each connection attempt
+        self._disconnected_event = asyncio.Event()
+        self._disconnected_event.set()
 
         logger.info(
             "Initialized NWWS-OI XMPP client - username: %s, server: %s, queue_maxsize: %d",
@@ -186,6 +204,109 @@ class WxWire(slixmpp.ClientXMPP):
                 self._message_queue.task_done()
                 return message
 
+    async def batches(
+        self,
+        max_size: int = 64,
+        max_wait_ms: float = 5,
+    ) -> AsyncIterator[list[NoaaPortMessage]]:
+        """Iterate over incoming weather messages in batches.
+
+        Waits for the next message like the async iterator protocol, then drains any
+        further queued messages without suspending, and finally waits up to max_wait_ms
+        for more to arrive until max_size messages are collected. Consumers doing little
+        work per message pay one event-loop wakeup per batch instead of per message.
+
+        Args:
+            max_size: Maximum number of messages yielded in a single batch.
+            max_wait_ms: Maximum time in milliseconds to wait for additional messages
+                        once the first message of a batch has been received.
+
+        Yields:
+            Non-empty lists of NoaaPortMessage objects in arrival order.
+
+        Raises:
+            ValueError: If max_size is less than 1 or max_wait_ms is negative.
+
+        Example:
+            ```python
+            async for messages in client.batches(max_size=64, max_wait_ms=5):
+                await store_messages(messages)
+            ```
+
+        """
+        if max_size < 1:
+            msg = f"Batch max_size must be at least 1, got {max_size}"
+            raise ValueError(msg)
+        if max_wait_ms < 0:
+            msg = f"Batch max_wait_ms must be non-negative, got {max_wait_ms}"
+            raise ValueError(msg)
+
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                batch = [await self.__anext__()]
+            except StopAsyncIteration:
+                return
+
+            deadline = loop.time() + max_wait_ms / 1000
+            while len(batch) < max_size:
+                try:
+                    message = self._message_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0 or self._stop_iteration:
+                        break
+                    try:
+                        message = await asyncio.wait_for(
+                            self._message_queue.get(), timeout=remaining
+                        )
+                    except TimeoutError:
+                        break
+                self._message_queue.task_done()
+                batch.append(message)
+
+            yield batch
+
+    async def stream_first(self, count: int) -> AsyncIterator[NoaaPortMessage]:
+        """Iterate over the next count weather messages, then stop the client.
+
+        Intended for short-lived consumers that only need a fixed number of messages.
+        The client is stopped as soon as the last requested message is received, so
+        it leaves the MUC room and disconnects instead of continuing to receive
+        messages that would be discarded.
+
+        Args:
+            count: Number of messages to yield before stopping.
+
+        Yields:
+            Up to count NoaaPortMessage objects in arrival order. Fewer are yielded
+            if the client is stopped before count messages arrive.
+
+        Raises:
+            ValueError: If count is less than 1.
+
+        Example:
+            ```python
+            await client.start()
+            async for message in client.stream_first(10):
+                print(message.awipsid)
+            ```
+
+        """
+        if count < 1:
+            msg = f"Message count must be at least 1, got {count}"
+            raise ValueError(msg)
+
+        for remaining in range(count, 0, -1):
+            try:
+                message = await self.__anext__()
+            except StopAsyncIteration:
+                return
+
+            if remaining == 1:
+                await self.stop("Requested message count reached")
+            yield message
+
     @property
     def queue_size(self) -> int:
         """Get the current number of messages pending in the processing queue.
@@ -201,7 +322,11 @@ class WxWire(slixmpp.ClientXMPP):
         """
         return self._message_queue.qsize()
 
-    def subscribe(self, handler: MessageHandler) -> None:
+    def subscribe(
+        self,
+        handler: MessageHandler,
+        prefixes: Iterable[str] | None = None,
+    ) -> None:
         """Subscribe a callback function to receive weather messages.
 
         Registers a callback function that will be invoked for each incoming weather
@@ -212,11 +337,23 @@ class WxWire(slixmpp.ClientXMPP):
         Multiple handlers can be registered and will all be called for each message.
         Handlers should be lightweight and fast to avoid blocking message processing.
 
+        When prefixes are given, the handler is only invoked for messages whose AWIPS ID
+        begins with one of them, such as a product category ("TOR", "SVR") or a full
+        AWIPS ID ("TORBOS"). Filtering happens in the dispatcher through a prefix lookup
+        table, one dictionary lookup per distinct prefix length, so handlers are never
+        called for messages they are not interested in and the cost does not grow with
+        the number of prefixes.
+
         Args:
             handler: A callable that accepts a NoaaPortMessage parameter. The handler
                     should not raise exceptions as this will be logged but not propagated.
-                    For async handlers, consider using asyncio.create_task() within
-                    the handler to avoid blocking.
+                    Async handlers are run as background tasks, see the note below.
+            prefixes: Optional iterable of AWIPS ID prefixes (1 to 6 characters) the
+                     handler is interested in. If omitted, the handler receives all messages.
+
+        Raises:
+            TypeError: If prefixes is a single string rather than an iterable of them.
+            ValueError: If a prefix is empty or longer than an AWIPS ID.
 
         Example:
             ```python
@@ -225,20 +362,39 @@ class WxWire(slixmpp.ClientXMPP):
 
             client = WxWire(config)
             client.subscribe(my_handler)
+            client.subscribe(alert_handler, prefixes=("TOR", "SVR"))
             await client.start()
             ```
 
         Note:
-            Subscribers are called synchronously within the message processing loop.
-            For CPU-intensive or I/O operations, consider using asyncio.create_task()
-            or threading within your handler to avoid blocking message processing.
+            Synchronous subscribers are called inline within the message processing loop.
+            Handlers returning an awaitable (such as ``async def`` functions) are run as
+            background tasks, with at most MAX_SUBSCRIBER_TASKS running at once. When
+            that limit is reached, the call is dropped and logged rather than queued, in
+            the same way the async iterator queue drops messages when full.
 
         """
         if handler in self._subscribers:
             logger.warning("Handler already subscribed, ignoring duplicate subscription")
             return
 
-        self._subscribers.add(handler)
+        if isinstance(prefixes, str):
+            msg = f"prefixes must be an iterable of strings, not a string: {prefixes!r}"
+            raise TypeError(msg)
+
+        prefix_filter: frozenset[str] | None = None
+        if prefixes is not None:
+            prefix_filter = frozenset(prefix.upper() for prefix in prefixes)
+            for prefix in prefix_filter:
+                if not 1 <= len(prefix) <= AWIPS_ID_MAX_LENGTH:
+                    msg = (
+                        f"AWIPS prefix must be 1 to {AWIPS_ID_MAX_LENGTH} characters, "
+                        f"got {prefix!r}"
+                    )
+                    raise ValueError(msg)
+
+        self._subscribers[handler] = prefix_filter
+        self._rebuild_subscriber_index()
         logger.info("Added message subscriber - total_subscribers: %d", len(self._subscribers))
 
     def unsubscribe(self, handler: MessageHandler) -> None:
@@ -272,9 +428,53 @@ class WxWire(slixmpp.ClientXMPP):
             logger.warning("Handler not found in subscribers, ignoring unsubscribe request")
             return
 
-        self._subscribers.discard(handler)
+        del self._subscribers[handler]
+        self._rebuild_subscriber_index()
         logger.info("Removed message subscriber - total_subscribers: %d", len(self._subscribers))
 
+    def _rebuild_subscriber_index(self) -> None:
+        """Rebuild the dispatch tables from the registered subscribers.
+
+        Subscribers without a filter are stored in a single tuple, while filtered
+        subscribers are grouped by AWIPS prefix so dispatch is a dictionary lookup
+        per distinct prefix length rather than a per-handler check. Tables are rebuilt
+        on registration changes only, keeping the per-message path free of filtering work.
+        """
+        unfiltered: list[MessageHandler] = []
+        by_prefix: dict[str, list[MessageHandler]] = {}
+        for handler, prefix_filter in self._subscribers.items():
+            if prefix_filter is None:
+                unfiltered.append(handler)
+                continue
+            for prefix in prefix_filter:
+                by_prefix.setdefault(prefix, []).append(handler)
+
+        self._unfiltered_subscribers = tuple(unfiltered)
+        self._subscribers_by_prefix = {
+            prefix: tuple(handlers) for prefix, handlers in by_prefix.items()
+        }
+        self._subscriber_prefix_lengths = tuple(sorted({len(prefix) for prefix in by_prefix}))
+
+    def _matching_subscribers(self, awipsid: str) -> tuple[MessageHandler, ...]:
+        """Return the subscribers that should receive a message with the given AWIPS ID.
+
+        Args:
+            awipsid: AWIPS ID of the message being dispatched.
+
+        Returns:
+            Unfiltered subscribers followed by those registered for a matching prefix,
+            each included once.
+
+        """
+        subscribers = self._unfiltered_subscribers
+        for length in self._subscriber_prefix_lengths:
+            subscribers += self._subscribers_by_prefix.get(awipsid[:length], ())
+
+        if len(self._subscriber_prefix_lengths) > 1:
+            # A handler may match on several prefix lengths, call it only once
+            subscribers = tuple(dict.fromkeys(subscribers))
+        return subscribers
+
     @property
     def subscriber_count(self) -> int:
         """Get the current number of registered message subscribers.
@@ -322,6 +522,9 @@ class WxWire(slixmpp.ClientXMPP):
         Calls each registered subscriber callback with the provided message.
         Subscriber calls are executed synchronously but with proper exception
         handling to ensure that a failing subscriber does not affect others.
+        Only unfiltered subscribers and those registered for the message's AWIPS
+        prefix are invoked. Awaitables returned by async subscribers are handed
+        to a bounded set of background tasks.
 
         Args:
             message: The weather message to deliver to subscribers.
@@ -329,10 +532,12 @@ class WxWire(slixmpp.ClientXMPP):
         """
         failed_subscribers: list[MessageHandler] = []
 
-        for subscriber in self._subscribers:
+        for subscriber in self._matching_subscribers(message.awipsid):
             try:
                 # Call subscriber synchronously to avoid concurrency issues
-                subscriber(message)
+                result: object = subscriber(message)
+                if inspect.isawaitable(result):
+                    self._start_subscriber_task(result)
             except (TypeError, ValueError, RuntimeError, AttributeError) as e:
                 logger.warning(
                     "Subscriber failed to process message - error: %s, error_type: %s",
@@ -359,6 +564,60 @@ class WxWire(slixmpp.ClientXMPP):
                 len(self._subscribers),
             )
 
+    def _start_subscriber_task(self, awaitable: Awaitable[object]) -> None:
+        """Run an async subscriber result as a background task with bounded concurrency.
+
+        The awaitable is discarded without being run when the client is shutting down
+        or MAX_SUBSCRIBER_TASKS handlers are already running.
+
+        Args:
+            awaitable: The awaitable returned by an async subscriber.
+
+        """
+        if self.is_shutting_down:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            return
+
+        if len(self._subscriber_tasks) >= MAX_SUBSCRIBER_TASKS:
+            if inspect.iscoroutine(awaitable):
+                awaitable.close()
+            self._dropped_subscriber_calls += 1
+            logger.warning(
+                "Async subscriber limit reached (%d running), dropping call - dropped_total: %d",
+                MAX_SUBSCRIBER_TASKS,
+                self._dropped_subscriber_calls,
+            )
+            return
+
+        task = asyncio.create_task(self._run_subscriber(awaitable), name="subscriber_handler")
+        self._subscriber_tasks.add(task)
+        task.add_done_callback(partial(self._on_subscriber_task_done, awaitable))
+
+    async def _run_subscriber(self, awaitable: Awaitable[object]) -> None:
+        """Await an async subscriber result, logging any failure."""
+        try:
+            await awaitable
+        except Exception as e:  # noqa: BLE001
+            # Catch all exceptions so a failing handler does not go unobserved
+            logger.warning(
+                "Async subscriber failed to process message - error: %s, error_type: %s",
+                str(e),
+                type(e).__name__,
+            )
+
+    def _on_subscriber_task_done(
+        self, awaitable: Awaitable[object], task: asyncio.Task[None]
+    ) -> None:
+        """Release the concurrency slot held by a finished subscriber task.
+
+        A task cancelled before its first step never awaits the handler result,
+        so the coroutine is closed here to avoid a "never awaited" warning.
+        """
+        self._subscriber_tasks.discard(task)
+        if task.cancelled() and inspect.iscoroutine(awaitable):
+            awaitable.close()
+
     def _add_event_handlers(self) -> None:
         """Add all necessary event handlers for the XMPP client."""
         # Connection events
@@ -410,6 +669,23 @@ class WxWire(slixmpp.ClientXMPP):
         connection_future = super().connect(host=self.config.server, port=self.config.port)  # type: ignore[misc]
         return await connection_future  # type: ignore[misc]
 
+    async def wait_disconnected(self) -> None:
+        """Wait until the client is disconnected from the NWWS-OI server.
+
+        Completes when the underlying XMPP connection is lost, closed or fails to be
+        established, allowing callers to react to a disconnect instead of polling the
+        connection state. Returns immediately on a client that has never connected,
+        and the wait is reset whenever a new connection attempt starts.
+
+        Example:
+            ```python
+            await client.start()
+            await client.wait_disconnected()
+            ```
+
+        """
+        await self._disconnected_event.wait()
+
     def is_client_connected(self) -> bool:
         """Determine if the client is currently connected and operational.
 
@@ -431,6 +707,7 @@ class WxWire(slixmpp.ClientXMPP):
         """Handle connection initiation."""
         logger.info("Starting connection attempt to NWWS-OI server")
         self._connection_start_time = time.time()
+        self._disconnected_event.clear()
 
     async def _on_reconnect_delay(self, delay_time: float) -> None:
         """Handle connection delay notification."""
@@ -443,6 +720,7 @@ class WxWire(slixmpp.ClientXMPP):
     async def _on_connection_failed(self, reason: str | Exception) -> None:
         """Handle connection failure."""
         logger.error("Connection to NWWS-OI server failed - reason: %s", str(reason))
+        self._disconnected_event.set()
 
     async def _on_connected(self, _event: object) -> None:
         """Handle successful connection."""
@@ -560,7 +838,7 @@ class WxWire(slixmpp.ClientXMPP):
             return
 
         # Check if the message is from the expected MUC room
-        if msg.get_mucroom() != JID(MUC_ROOM).bare:
+        if msg.get_mucroom() != _MUC_ROOM_BARE:
             logger.warning(
                 "Message not from %s room, skipping - from_jid: %s",
                 MUC_ROOM,
@@ -657,10 +935,12 @@ class WxWire(slixmpp.ClientXMPP):
     async def _on_disconnected(self, reason: str | Exception) -> None:
         """Handle disconnection."""
         logger.warning("Disconnected from NWWS-OI server - reason: %s", str(reason))
+        self._disconnected_event.set()
 
     async def _on_killed(self, _event: object) -> None:
         """Handle forceful connection termination."""
         logger.warning("Connection forcefully terminated")
+        self._disconnected_event.set()
 
     async def stop(self, reason: str | None = None) -> None:
         """Perform graceful shutdown of the NWWS-OI client with proper cleanup.
@@ -674,7 +954,7 @@ class WxWire(slixmpp.ClientXMPP):
         ensure data integrity:
         1. Set shutdown flag to prevent new operations
         2. Signal async iterator to stop accepting new messages
-        3. Cancel all background monitoring and stats collection tasks
+        3. Cancel all background monitoring, stats collection, and async subscriber tasks
         4. Leave the NWWS MUC room with proper unsubscribe protocol
         5. Disconnect from the XMPP server with connection cleanup
         6. Update final connection status in stats collector
@@ -701,6 +981,10 @@ class WxWire(slixmpp.ClientXMPP):
         # Cancel all monitoring tasks
         self._stop_background_services()
 
+        # Cancel in-flight async subscriber handlers
+        for task in tuple(self._subscriber_tasks):
+            task.cancel()
+
         # Leave MUC room gracefully
         self._leave_muc_room()
 
@@ -0,0 +1,46 @@
+"""Unit tests for config.py module."""
+
+from typing import Any
+
+import pytest
+
+from nwws_receiver.config import ConfigurationError, WxWireConfig
+
+
+class TestWxWireConfigValidation:
+    """Test WxWireConfig field validation."""
+
+    def test_defaults_are_valid(self) -> None:
+        """Test that the default configuration passes validation."""
+        config = WxWireConfig()
+
+        assert config.port == 5222
+        assert config.history == 10
+
+    @pytest.mark.parametrize("port", [1, 5222, 65535])
+    def test_port_in_range_is_accepted(self, port: int) -> None:
+        """Test that ports within 1-65535 are accepted."""
+        assert WxWireConfig(port=port).port == port
+
+    @pytest.mark.parametrize("port", [0, -1, 65536])
+    def test_port_out_of_range_is_rejected(self, port: int) -> None:
+        """Test that ports outside 1-65535 are rejected."""
+        with pytest.raises(ConfigurationError, match="Port must be between 1 and 65535"):
+            WxWireConfig(port=port)
+
+    @pytest.mark.parametrize("port", ["5222", 5222.0, None])
+    def test_port_non_integer_is_rejected(self, port: Any) -> None:
+        """Test that a port that is not an integer is rejected."""
+        with pytest.raises(ConfigurationError, match="Port must be an integer"):
+            WxWireConfig(port=port)
+
+    def test_negative_history_is_rejected(self) -> None:
+        """Test that a negative history is rejected."""
+        with pytest.raises(ConfigurationError, match="History must be non-negative"):
+            WxWireConfig(history=-1)
+
+    @pytest.mark.parametrize("history", ["5", 5.0, None])
+    def test_history_non_integer_is_rejected(self, history: Any) -> None:
+        """Test that a history that is not an integer is rejected."""
+        with pytest.raises(ConfigurationError, match="History must be an integer"):
+            WxWireConfig(history=history)
@@ -1,24 +1,52 @@
 """Comprehensive unit tests for wx_wire.py module."""
 
 import asyncio
+import gc
 import time
+import warnings
+from collections.abc import Callable
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, Mock, patch
+from typing import Any
+from unittest.mock import AsyncMock, Mock, NonCallableMock, patch
 from xml.etree import ElementTree as ET
 
 import pytest
-from slixmpp import JID
 from slixmpp.stanza import Message
 
 from nwws_receiver.config import WxWireConfig
 from nwws_receiver.message import NoaaPortMessage
-from nwws_receiver.wx_wire import IDLE_TIMEOUT, MUC_ROOM, WxWire
+from nwws_receiver.wx_wire import (
+    _MUC_ROOM_BARE,
+    IDLE_TIMEOUT,
+    MAX_SUBSCRIBER_TASKS,
+    MUC_ROOM,
+    WxWire,
+)
+
+WxWireFactory = Callable[[WxWireConfig], WxWire]
+
+
+def _make_messages(count: int) -> list[NoaaPortMessage]:
+    """Build count distinct test messages sharing one issue time."""
+    issue = datetime.now(UTC)
+    return [
+        NoaaPortMessage(
+            subject=f"Test {i}",
+            noaaport=f"Content {i}",
+            id=f"id_{i}",
+            issue=issue,
+            ttaaii="NOUS41",
+            cccc="KOKX",
+            awipsid=f"TEST{i:02d}",
+        )
+        for i in range(count)
+    ]
 
 
 class TestWxWireInit:
     """Test WxWire initialization and setup."""
 
-    def test_init_with_valid_config(self) -> None:
+    def test_init_with_valid_config(self, make_wx_wire: WxWireFactory) -> None:
         """Test initialization with valid configuration."""
         config = WxWireConfig(
             username="testuser",
@@ -29,7 +57,7 @@ class TestWxWireInit:
         )
 
         with patch("nwws_receiver.wx_wire.WxWire.register_plugin") as mock_register:
-            wx_wire = WxWire(config)
+            wx_wire = make_wx_wire(config)
 
             assert wx_wire.config == config
             assert wx_wire.nickname.startswith("202")  # Current year prefix
@@ -49,7 +77,7 @@ class TestWxWireInit:
             for plugin in expected_plugins:
                 mock_register.assert_any_call(plugin)
 
-    def test_init_sets_nickname_with_timestamp(self) -> None:
+    def test_init_sets_nickname_with_timestamp(self, make_wx_wire: WxWireFactory) -> None:
         """Test that nickname is set with current timestamp."""
         config = WxWireConfig(username="testuser", password="testpass")
 
@@ -59,15 +87,15 @@ class TestWxWireInit:
             mock_datetime.now.return_value = mock_now
             mock_datetime.UTC = UTC
 
-            wx_wire = WxWire(config)
+            wx_wire = make_wx_wire(config)
             assert wx_wire.nickname == "202312251430"
 
-    def test_event_handlers_registered(self) -> None:
+    def test_event_handlers_registered(self, make_wx_wire: WxWireFactory) -> None:
         """Test that all required event handlers are registered."""
         config = WxWireConfig(username="testuser", password="testpass")
 
         with patch("nwws_receiver.wx_wire.WxWire.add_event_handler") as mock_add_handler:
-            WxWire(config)
+            make_wx_wire(config)
 
             expected_handlers = [
                 "connecting",
@@ -91,10 +119,10 @@ class TestWxWireAsyncIterator:
     """Test async iterator protocol implementation."""
 
     @pytest.fixture
-    def wx_wire(self) -> WxWire:
+    def wx_wire(self, make_wx_wire: WxWireFactory) -> WxWire:
         """Create WxWire instance for testing."""
         config = WxWireConfig(username="testuser", password="testpass")
-        return WxWire(config)
+        return make_wx_wire(config)
 
     def test_aiter_returns_self(self, wx_wire: WxWire) -> None:
         """Test that __aiter__ returns self."""
@@ -135,22 +163,11 @@ class TestWxWireAsyncIterator:
 
     async def test_async_iteration_with_for_loop(self, wx_wire: WxWire) -> None:
         """Test async iteration in a for loop context."""
-        test_messages = [
-            NoaaPortMessage(
-                subject=f"Test {i}",
-                noaaport=f"Content {i}",
-                id=f"id_{i}",
-                issue=datetime.now(UTC),
-                ttaaii="NOUS41",
-                cccc="KOKX",
-                awipsid=f"TEST{i:02d}",
-            )
-            for i in range(3)
-        ]
+        test_messages = _make_messages(3)
 
         # Put messages in queue
         for msg in test_messages:
-            await wx_wire._message_queue.put(msg)
+            wx_wire._message_queue.put_nowait(msg)
 
         # Signal stop after messages
         wx_wire._stop_iteration = True
@@ -162,15 +179,81 @@ class TestWxWireAsyncIterator:
 
         assert collected_messages == test_messages
 
+    async def test_batches_drains_queued_messages(self, wx_wire: WxWire) -> None:
+        """Test that batches yields queued messages together up to max_size."""
+        test_messages = _make_messages(5)
+
+        for msg in test_messages:
+            wx_wire._message_queue.put_nowait(msg)
+
+        wx_wire._stop_iteration = True
+
+        batches = [batch async for batch in wx_wire.batches(max_size=3, max_wait_ms=0)]
+
+        assert batches == [test_messages[:3], test_messages[3:]]
+        assert wx_wire.queue_size == 0
+
+    async def test_batches_flushes_partial_batch_after_max_wait(self, wx_wire: WxWire) -> None:
+        """Test that batches waits for late messages, then yields a partial batch on timeout."""
+        test_messages = _make_messages(2)
+        wx_wire._message_queue.put_nowait(test_messages[0])
+        # Arrives while the batch is waiting for more messages
+        asyncio.get_running_loop().call_soon(wx_wire._message_queue.put_nowait, test_messages[1])
+
+        batches = wx_wire.batches(max_size=5, max_wait_ms=10)
+        try:
+            batch = await asyncio.wait_for(anext(batches), timeout=1)
+        finally:
+            await batches.aclose()
+
+        assert batch == test_messages
+        assert wx_wire.queue_size == 0
+
+    async def test_batches_stops_when_shutting_down(self, wx_wire: WxWire) -> None:
+        """Test that batches ends iteration when stopped with an empty queue."""
+        wx_wire._stop_iteration = True
+
+        batches = [batch async for batch in wx_wire.batches()]
+
+        assert batches == []
+
+    async def test_batches_rejects_invalid_max_size(self, wx_wire: WxWire) -> None:
+        """Test that batches rejects a non-positive max_size."""
+        with pytest.raises(ValueError, match="max_size must be at least 1"):
+            await anext(wx_wire.batches(max_size=0))
+
+    async def test_stream_first_yields_count_and_stops(self, wx_wire: WxWire) -> None:
+        """Test that stream_first yields the requested count and then stops the client."""
+        test_messages = _make_messages(3)
+
+        for msg in test_messages:
+            wx_wire._message_queue.put_nowait(msg)
+
+        with patch.object(wx_wire, "stop", new_callable=AsyncMock) as mock_stop:
+            collected = [message async for message in wx_wire.stream_first(2)]
+
+            assert collected == test_messages[:2]
+            mock_stop.assert_called_once_with("Requested message count reached")
+
+    async def test_stream_first_ends_early_when_shutting_down(self, wx_wire: WxWire) -> None:
+        """Test that stream_first ends without stopping again if iteration is stopped."""
+        wx_wire._stop_iteration = True
+
+        with patch.object(wx_wire, "stop", new_callable=AsyncMock) as mock_stop:
+            collected = [message async for message in wx_wire.stream_first(5)]
+
+            assert collected == []
+            mock_stop.assert_not_called()
+
 
 class TestWxWireProperties:
     """Test WxWire properties."""
 
     @pytest.fixture
-    def wx_wire(self) -> WxWire:
+    def wx_wire(self, make_wx_wire: WxWireFactory) -> WxWire:
         """Create WxWire instance for testing."""
         config = WxWireConfig(username="testuser", password="testpass")
-        return WxWire(config)
+        return make_wx_wire(config)
 
     async def test_queue_size_property(self, wx_wire: WxWire) -> None:
         """Test queue_size property returns correct size."""
@@ -197,12 +280,12 @@ class TestWxWireConnectionManagement:
     """Test connection management methods."""
 
     @pytest.fixture
-    def wx_wire(self) -> WxWire:
+    def wx_wire(self, make_wx_wire: WxWireFactory) -> WxWire:
         """Create WxWire instance for testing."""
         config = WxWireConfig(
             username="testuser", password="testpass", server="test.example.com", port=5222
         )
-        return WxWire(config)
+        return make_wx_wire(config)
 
     async def test_start_calls_parent_connect(self, wx_wire: WxWire) -> None:
         """Test start method calls parent connect with correct parameters."""
@@ -276,10 +359,10 @@ class TestWxWireEventHandlers:
     """Test event handler methods."""
 
     @pytest.fixture
-    def wx_wire(self) -> WxWire:
+    def wx_wire(self, make_wx_wire: WxWireFactory) -> WxWire:
         """Create WxWire instance for testing."""
         config = WxWireConfig(username="testuser", password="testpass")
-        return WxWire(config)
+        return make_wx_wire(config)
 
     async def test_on_connecting_sets_start_time(self, wx_wire: WxWire) -> None:
         """Test _on_connecting sets connection start time."""
@@ -361,6 +444,46 @@ class TestWxWireEventHandlers:
                 "Disconnected from NWWS-OI server - reason: %s", "Connection lost"
             )
 
+    async def test_wait_disconnected_completes_on_disconnect(self, wx_wire: WxWire) -> None:
+        """Test wait_disconnected completes once the client is disconnected."""
+        await wx_wire._on_connecting(None)
+        waiter = asyncio.create_task(wx_wire.wait_disconnected())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await wx_wire._on_disconnected("Connection lost")
+
+        await asyncio.wait_for(waiter, timeout=1)
+
+    async def test_wait_disconnected_returns_when_never_connected(self, wx_wire: WxWire) -> None:
+        """Test wait_disconnected does not block on a client that never connected."""
+        await asyncio.wait_for(wx_wire.wait_disconnected(), timeout=1)
+
+    async def test_wait_disconnected_completes_on_failed_connection(self, wx_wire: WxWire) -> None:
+        """Test wait_disconnected completes when a connection attempt fails."""
+        await wx_wire._on_connecting(None)
+        waiter = asyncio.create_task(wx_wire.wait_disconnected())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await wx_wire._on_connection_failed("Connection refused")
+
+        await asyncio.wait_for(waiter, timeout=1)
+
+    async def test_on_killed_sets_disconnected_state(self, wx_wire: WxWire) -> None:
+        """Test a forcefully terminated connection counts as disconnected."""
+        await wx_wire._on_connecting(None)
+        await wx_wire._on_killed(None)
+
+        assert wx_wire._disconnected_event.is_set()
+
+    async def test_on_connecting_resets_disconnected_state(self, wx_wire: WxWire) -> None:
+        """Test a new connection attempt resets the disconnected state."""
+        await wx_wire._on_disconnected("Connection lost")
+        await wx_wire._on_connecting(None)
+
+        assert not wx_wire._disconnected_event.is_set()
+
     async def test_on_killed_logs_termination(self, wx_wire: WxWire) -> None:
         """Test _on_killed logs forceful termination."""
         with patch("nwws_receiver.wx_wire.logger") as mock_logger:
@@ -393,10 +516,10 @@ class TestWxWireBackgroundServices:
     """Test background service management."""
 
     @pytest.fixture
-    def wx_wire(self) -> WxWire:
+    def wx_wire(self, make_wx_wire: WxWireFactory) -> WxWire:
         """Create WxWire instance for testing."""
         config = WxWireConfig(username="testuser", password="testpass")
-        return WxWire(config)
+        return make_wx_wire(config)
 
     async def test_start_background_services_creates_tasks(self, wx_wire: WxWire) -> None:
         """Test _start_background_services creates necessary tasks."""
@@ -465,10 +588,10 @@ class TestWxWireMucOperations:
     """Test MUC room operations."""
 
     @pytest.fixture
-    def wx_wire(self) -> WxWire:
+    def wx_wire(self, make_wx_wire: WxWireFactory) -> WxWire:
         """Create WxWire instance for testing."""
         config = WxWireConfig(username="testuser", password="testpass")
-        wx_wire = WxWire(config)
+        wx_wire = make_wx_wire(config)
         wx_wire.plugin = {"xep_0045": Mock()}
         return wx_wire
 
@@ -591,32 +714,32 @@ class TestWxWireMessageProcessing:
     """Test message processing functionality."""
 
     @pytest.fixture
-    def wx_wire(self) -> WxWire:
+    def wx_wire(self, make_wx_wire: WxWireFactory) -> WxWire:
         """Create WxWire instance for testing."""
         config = WxWireConfig(username="testuser", password="testpass")
-        return WxWire(config)
+        return make_wx_wire(config)
 
     @pytest.fixture
     def mock_message(self) -> Message:
         """Create mock XMPP message with NWWS-OI content."""
         msg = Mock(spec=Message)
-        msg.get_mucroom.return_value = JID(MUC_ROOM).bare
+        msg.get_mucroom.return_value = _MUC_ROOM_BARE
         msg.get_id.return_value = "test_msg_id"
-        msg.get.side_effect = lambda key, default="": {
+        msg.get.side_effect = {
             "body": "Test weather alert",
             "subject": "Weather Alert Subject",
-        }.get(key, default)
+        }.get
 
         # Create mock XML with NWWS-OI namespace
-        mock_xml = Mock()
-        mock_x_element = Mock()
-        mock_x_element.get.side_effect = lambda key, default="": {
+        mock_xml = NonCallableMock()
+        mock_x_element = NonCallableMock()
+        mock_x_element.get.side_effect = {
             "id": "test_product_id",
             "issue": "2023-12-25T14:30:00Z",
             "ttaaii": "NOUS41",
             "cccc": "KOKX",
             "awipsid": "AFDOKX",
-        }.get(key, default)
+        }.get
         mock_x_element.text = "This is the weather product content\n\nWith multiple lines"
 
         mock_xml.find.return_value = mock_x_element
@@ -752,7 +875,7 @@ class TestWxWireMessageProcessing:
     ) -> None:
         """Test _on_nwws_message returns None when NWWS-OI namespace missing."""
         mock_msg = Mock(spec=Message)
-        mock_msg.xml = Mock()
+        mock_msg.xml = NonCallableMock()
         mock_msg.xml.find.return_value = None
         mock_msg.get_id.return_value = "test_id"
 
@@ -768,8 +891,8 @@ class TestWxWireMessageProcessing:
     async def test_on_nwws_message_returns_none_for_empty_body(self, wx_wire: WxWire) -> None:
         """Test _on_nwws_message returns None for messages with empty body."""
         mock_msg = Mock(spec=Message)
-        mock_msg.xml = Mock()
-        mock_x_element = Mock()
+        mock_msg.xml = NonCallableMock()
+        mock_x_element = NonCallableMock()
         mock_x_element.text = ""  # Empty body
         mock_msg.xml.find.return_value = mock_x_element
         mock_msg.get_id.return_value = "test_id"
@@ -788,8 +911,8 @@ class TestWxWireMessageProcessing:
     def test_extract_wmo_id_if_possible_success(self, wx_wire: WxWire) -> None:
         """Test _extract_wmo_id_if_possible extracts office ID successfully."""
         mock_msg = Mock(spec=Message)
-        mock_msg.xml = Mock()
-        mock_x_element = Mock()
+        mock_msg.xml = NonCallableMock()
+        mock_x_element = NonCallableMock()
         mock_x_element.get.return_value = "KBOS"
         mock_msg.xml.find.return_value = mock_x_element
 
@@ -799,7 +922,7 @@ class TestWxWireMessageProcessing:
     def test_extract_wmo_id_if_possible_returns_none_on_error(self, wx_wire: WxWire) -> None:
         """Test _extract_wmo_id_if_possible returns None on errors."""
         mock_msg = Mock(spec=Message)
-        mock_msg.xml = Mock()
+        mock_msg.xml = NonCallableMock()
         mock_msg.xml.find.side_effect = Exception("Parse error")
 
         result = wx_wire._extract_wmo_id_if_possible(mock_msg)
@@ -810,18 +933,35 @@ class TestWxWireUtilities:
     """Test utility methods."""
 
     @pytest.fixture
-    def wx_wire(self) -> WxWire:
+    def wx_wire(self, make_wx_wire: WxWireFactory) -> WxWire:
         """Create WxWire instance for testing."""
         config = WxWireConfig(username="testuser", password="testpass")
-        return WxWire(config)
-
-    def test_parse_issue_timestamp_valid_iso_format(self, wx_wire: WxWire) -> None:
+        return make_wx_wire(config)
+
+    @pytest.mark.parametrize(
+        ("issue_str", "expected"),
+        [
+            ("2023-12-25T14:30:00Z", datetime(2023, 12, 25, 14, 30, tzinfo=UTC)),
+            ("2023-12-25T14:30:00+00:00", datetime(2023, 12, 25, 14, 30, tzinfo=UTC)),
+            ("2023-12-25T14:30:00.123Z", datetime(2023, 12, 25, 14, 30, 0, 123000, tzinfo=UTC)),
+        ],
+        ids=["zulu", "offset", "milliseconds"],
+    )
+    def test_parse_issue_timestamp_valid_iso_format(
+        self, wx_wire: WxWire, issue_str: str, expected: datetime
+    ) -> None:
         """Test _parse_issue_timestamp with valid ISO format."""
-        result = wx_wire._parse_issue_timestamp("2023-12-25T14:30:00Z")
-        expected = datetime(2023, 12, 25, 14, 30, tzinfo=UTC)
+        result = wx_wire._parse_issue_timestamp(issue_str)
         assert result == expected
 
-    def test_parse_issue_timestamp_invalid_format_uses_current_time(self, wx_wire: WxWire) -> None:
+    @pytest.mark.parametrize(
+        "issue_str",
+        ["invalid-timestamp", "", "2023-13-32T25:70:70Z"],
+        ids=["garbage", "empty", "out-of-range"],
+    )
+    def test_parse_issue_timestamp_invalid_format_uses_current_time(
+        self, wx_wire: WxWire, issue_str: str
+    ) -> None:
         """Test _parse_issue_timestamp with invalid format uses current time."""
         with (
             patch("nwws_receiver.wx_wire.datetime") as mock_datetime,
@@ -830,15 +970,15 @@ class TestWxWireUtilities:
             current_time = datetime(2023, 12, 25, 15, 0, tzinfo=UTC)
             mock_datetime.now.return_value = current_time
             mock_datetime.UTC = UTC
-            # Mock fromisoformat to raise ValueError for invalid timestamps
-            mock_datetime.fromisoformat.side_effect = ValueError("Invalid format")
+            # Parse with the real implementation so each input fails on its own merits
+            mock_datetime.fromisoformat.side_effect = datetime.fromisoformat
 
-            result = wx_wire._parse_issue_timestamp("invalid-timestamp")
+            result = wx_wire._parse_issue_timestamp(issue_str)
 
             assert result == current_time
             mock_logger.warning.assert_called_with(
                 "Invalid issue time format, using current time - issue_str: %s",
-                "invalid-timestamp",
+                issue_str,
             )
 
     def test_calculate_delay_secs_positive_delay(self, wx_wire: WxWire) -> None:
@@ -910,44 +1050,38 @@ class TestWxWireIntegration:
             history=5,
         )
 
-    async def test_full_message_processing_workflow(self, config: WxWireConfig) -> None:
+    async def test_full_message_processing_workflow(
+        self,
+        config: WxWireConfig,
+        make_wx_wire: WxWireFactory,
+        make_xmpp_message: Callable[..., Any],
+    ) -> None:
         """Test complete message processing workflow from XMPP to NoaaPortMessage."""
-        wx_wire = WxWire(config)
-
-        # Create realistic XMPP message
-        mock_msg = Mock(spec=Message)
-        mock_msg.get_mucroom.return_value = JID(MUC_ROOM).bare
-        mock_msg.get_id.return_value = "msg_12345"
-        mock_msg.get.side_effect = lambda key, default="": {
-            "body": "URGENT - WEATHER MESSAGE",
-            "subject": "Severe Weather Alert",
-        }.get(key, default)
-
-        # Setup XML namespace content
-        mock_xml = Mock()
-        mock_x_element = Mock()
-        mock_x_element.get.side_effect = lambda key, default="": {
-            "id": "prod_67890",
-            "issue": "2023-12-25T16:45:00Z",
-            "ttaaii": "WFUS51",
-            "cccc": "KBOS",
-            "awipsid": "SVRBOS",
-        }.get(key, default)
-        mock_x_element.text = (
-            "URGENT - WEATHER MESSAGE\n"
-            "NATIONAL WEATHER SERVICE BOSTON MA\n\n"
-            "SEVERE THUNDERSTORM WARNING FOR...\n"
-            "MIDDLESEX COUNTY IN EASTERN MASSACHUSETTS...\n\n"
-            "AT 445 PM EST...A SEVERE THUNDERSTORM WAS LOCATED..."
+        wx_wire = make_wx_wire(config)
+
+        # Create realistic XMPP message from the NWWS-OI room, without a delay stamp
+        mock_msg = make_xmpp_message(
+            msg_id="msg_12345",
+            fields={
+                "body": "URGENT - WEATHER MESSAGE",
+                "subject": "Severe Weather Alert",
+            },
+            x_attrs={
+                "id": "prod_67890",
+                "issue": "2023-12-25T16:45:00Z",
+                "ttaaii": "WFUS51",
+                "cccc": "KBOS",
+                "awipsid": "SVRBOS",
+            },
+            text=(
+                "URGENT - WEATHER MESSAGE\n"
+                "NATIONAL WEATHER SERVICE BOSTON MA\n\n"
+                "SEVERE THUNDERSTORM WARNING FOR...\n"
+                "MIDDLESEX COUNTY IN EASTERN MASSACHUSETTS...\n\n"
+                "AT 445 PM EST...A SEVERE THUNDERSTORM WAS LOCATED..."
+            ),
         )
 
-        mock_xml.find.return_value = mock_x_element
-        mock_msg.xml = mock_xml
-
-        # Mock delay handling
-        mock_msg.__contains__ = lambda self, key: False  # No delay
-        mock_msg.__getitem__ = lambda self, key: None
-
         # Process the message
         await wx_wire._on_groupchat_message(mock_msg)
 
@@ -968,15 +1102,18 @@ class TestWxWireIntegration:
         assert processed_msg.noaaport.startswith("\x01")
         assert processed_msg.noaaport.endswith("\x03")
 
-    async def test_shutdown_during_message_processing(self, config: WxWireConfig) -> None:
+    async def test_shutdown_during_message_processing(
+        self, config: WxWireConfig, make_wx_wire: WxWireFactory
+    ) -> None:
         """Test graceful shutdown during active message processing."""
-        wx_wire = WxWire(config)
+        wx_wire = make_wx_wire(config)
 
         # Start processing messages
         message_task = asyncio.create_task(wx_wire.__anext__())
 
-        # Give the task a moment to start waiting
-        await asyncio.sleep(0.1)
+        # A single loop iteration is enough for the task to block on the empty queue
+        await asyncio.sleep(0)
+        assert not message_task.done()
 
         # Initiate shutdown
         await wx_wire.stop("Integration test shutdown")
@@ -989,28 +1126,31 @@ class TestWxWireIntegration:
         assert wx_wire.is_shutting_down
         assert wx_wire._stop_iteration
 
-    async def test_queue_backpressure_handling(self, config: WxWireConfig) -> None:
+    async def test_queue_backpressure_handling(
+        self, config: WxWireConfig, make_wx_wire: WxWireFactory
+    ) -> None:
         """Test queue backpressure and message dropping."""
-        wx_wire = WxWire(config)
+        wx_wire = make_wx_wire(config)
 
         # Create multiple test messages
-        test_messages = []
-        for i in range(wx_wire._message_queue.maxsize + 5):  # More than queue capacity
-            msg = NoaaPortMessage(
+        issue = datetime.now(UTC)
+        test_messages = [
+            NoaaPortMessage(
                 subject=f"Message {i}",
                 noaaport=f"Content {i}",
                 id=f"msg_{i}",
-                issue=datetime.now(UTC),
+                issue=issue,
                 ttaaii="NOUS41",
                 cccc="KOKX",
                 awipsid=f"TEST{i:02d}",
             )
-            test_messages.append(msg)
+            for i in range(wx_wire._message_queue.maxsize + 5)  # More than queue capacity
+        ]
 
         # Fill queue beyond capacity
         for i, msg in enumerate(test_messages):
             if i < wx_wire._message_queue.maxsize:
-                await wx_wire._message_queue.put(msg)
+                wx_wire._message_queue.put_nowait(msg)
             else:
                 # These should be dropped due to queue full
                 try:
@@ -1022,9 +1162,9 @@ class TestWxWireIntegration:
         assert wx_wire.queue_size == wx_wire._message_queue.maxsize
 
         # Consume messages and verify order
-        consumed_messages = []
-        for _ in range(wx_wire._message_queue.maxsize):
-            consumed_messages.append(await wx_wire._message_queue.get())
+        consumed_messages = [
+            wx_wire._message_queue.get_nowait() for _ in range(wx_wire._message_queue.maxsize)
+        ]
 
         # Should have first maxsize messages, rest were dropped
         assert len(consumed_messages) == wx_wire._message_queue.maxsize
@@ -1035,10 +1175,10 @@ class TestWxWireSubscriberPattern:
     """Test subscribe/unsubscribe functionality."""
 
     @pytest.fixture
-    def wx_wire(self) -> WxWire:
+    def wx_wire(self, make_wx_wire: WxWireFactory) -> WxWire:
         """Create WxWire instance for testing."""
         config = WxWireConfig(username="testuser", password="testpass")
-        return WxWire(config)
+        return make_wx_wire(config)
 
     @pytest.fixture
     def sample_message(self) -> NoaaPortMessage:
@@ -1207,6 +1347,188 @@ class TestWxWireSubscriberPattern:
         queued_message = await wx_wire._message_queue.get()
         assert queued_message == sample_message
 
+    async def test_prefix_subscriber_receives_matching_messages(
+        self, wx_wire: WxWire, sample_message: NoaaPortMessage
+    ) -> None:
+        """Test that prefix-filtered subscribers only receive matching messages."""
+        matching_handler = Mock()
+        other_handler = Mock()
+        all_handler = Mock()
+
+        wx_wire.subscribe(matching_handler, prefixes=("TES", "TOR"))
+        wx_wire.subscribe(other_handler, prefixes=("SVR",))
+        wx_wire.subscribe(all_handler)
+
+        await wx_wire._notify_subscribers(sample_message)
+
+        matching_handler.assert_called_once_with(sample_message)
+        other_handler.assert_not_called()
+        all_handler.assert_called_once_with(sample_message)
+
+    async def test_unsubscribe_removes_prefix_subscriber(
+        self, wx_wire: WxWire, sample_message: NoaaPortMessage
+    ) -> None:
+        """Test that unsubscribing removes a handler from the prefix dispatch table."""
+        handler = Mock()
+
+        wx_wire.subscribe(handler, prefixes=("tes",))
+        wx_wire.unsubscribe(handler)
+
+        await wx_wire._notify_subscribers(sample_message)
+
+        handler.assert_not_called()
+        assert wx_wire._subscribers_by_prefix == {}
+
+    async def test_prefix_subscriber_matches_mixed_prefix_lengths(
+        self, wx_wire: WxWire, sample_message: NoaaPortMessage
+    ) -> None:
+        """Test that prefixes of different lengths match and call a handler only once."""
+        handler = Mock()
+        other_office_handler = Mock()
+
+        wx_wire.subscribe(handler, prefixes=("TES", "TESTOK"))
+        wx_wire.subscribe(other_office_handler, prefixes=("TESTBO",))
+
+        await wx_wire._notify_subscribers(sample_message)
+
+        handler.assert_called_once_with(sample_message)
+        other_office_handler.assert_not_called()
+
+    def test_subscribe_rejects_invalid_prefix(self, wx_wire: WxWire) -> None:
+        """Test that subscribe rejects empty prefixes or ones longer than an AWIPS ID."""
+        handler = Mock()
+
+        with pytest.raises(ValueError, match="AWIPS prefix must be 1 to 6 characters"):
+            wx_wire.subscribe(handler, prefixes=("TORNADO",))
+
+        with pytest.raises(ValueError, match="AWIPS prefix must be 1 to 6 characters"):
+            wx_wire.subscribe(handler, prefixes=("",))
+
+        assert wx_wire.subscriber_count == 0
+
+    def test_subscribe_rejects_bare_string_prefixes(self, wx_wire: WxWire) -> None:
+        """Test that a bare string is not split into single-character prefixes."""
+        handler = Mock()
+
+        with pytest.raises(TypeError, match="not a string: 'TOR'"):
+            wx_wire.subscribe(handler, prefixes="TOR")
+
+        assert wx_wire.subscriber_count == 0
+
+    async def test_notify_subscribers_runs_async_handler_as_task(
+        self, wx_wire: WxWire, sample_message: NoaaPortMessage
+    ) -> None:
+        """Test that async subscribers are run as tracked background tasks."""
+        handled = asyncio.Event()
+
+        async def async_handler(message: NoaaPortMessage) -> None:
+            assert message == sample_message
+            handled.set()
+
+        wx_wire.subscribe(async_handler)
+
+        await wx_wire._notify_subscribers(sample_message)
+        assert len(wx_wire._subscriber_tasks) == 1
+
+        await asyncio.wait_for(handled.wait(), timeout=1)
+        await asyncio.gather(*wx_wire._subscriber_tasks)
+        await asyncio.sleep(0)  # Let done callbacks run
+        assert wx_wire._subscriber_tasks == set()
+
+    async def test_notify_subscribers_bounds_async_handler_concurrency(
+        self, wx_wire: WxWire, sample_message: NoaaPortMessage
+    ) -> None:
+        """Test that async handler calls are dropped when the task limit is reached."""
+        release = asyncio.Event()
+        started: list[NoaaPortMessage] = []
+
+        async def slow_handler(message: NoaaPortMessage) -> None:
+            started.append(message)
+            await release.wait()
+
+        wx_wire.subscribe(slow_handler)
+
+        with (
+            patch("nwws_receiver.wx_wire.MAX_SUBSCRIBER_TASKS", 1),
+            patch("nwws_receiver.wx_wire.logger") as mock_logger,
+        ):
+            await wx_wire._notify_subscribers(sample_message)
+            await wx_wire._notify_subscribers(sample_message)
+
+            mock_logger.warning.assert_called_once_with(
+                "Async subscriber limit reached (%d running), dropping call - dropped_total: %d",
+                1,
+                1,
+            )
+
+        assert len(wx_wire._subscriber_tasks) == 1
+        assert wx_wire._dropped_subscriber_calls == 1
+
+        release.set()
+        await asyncio.gather(*wx_wire._subscriber_tasks)
+        await asyncio.sleep(0)  # Let done callbacks run
+        assert wx_wire._subscriber_tasks == set()
+        assert len(started) == 1
+
+    async def test_stop_closes_pending_async_handlers(
+        self, wx_wire: WxWire, sample_message: NoaaPortMessage
+    ) -> None:
+        """Test that stop() leaves no unawaited handlers and starts none afterwards."""
+        started: list[NoaaPortMessage] = []
+
+        async def slow_handler(message: NoaaPortMessage) -> None:
+            started.append(message)
+            await asyncio.Event().wait()
+
+        wx_wire.subscribe(slow_handler)
+
+        # Fill every slot, plus one call over the limit, before any handler has run
+        for _ in range(MAX_SUBSCRIBER_TASKS + 1):
+            await wx_wire._notify_subscribers(sample_message)
+        assert len(wx_wire._subscriber_tasks) == MAX_SUBSCRIBER_TASKS
+
+        with (
+            patch.object(wx_wire, "_leave_muc_room"),
+            patch.object(wx_wire, "disconnect", new_callable=AsyncMock),
+            warnings.catch_warnings(record=True) as caught,
+        ):
+            warnings.simplefilter("always")
+            await wx_wire.stop()
+
+            # A dispatch arriving after stop() must not start a new handler
+            await wx_wire._notify_subscribers(sample_message)
+
+            tasks = list(wx_wire._subscriber_tasks)
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.sleep(0)  # Let done callbacks run
+            del tasks
+            gc.collect()
+
+        assert started == []
+        assert wx_wire._subscriber_tasks == set()
+        assert not [w for w in caught if issubclass(w.category, RuntimeWarning)]
+
+    async def test_async_subscriber_exception_is_logged(
+        self, wx_wire: WxWire, sample_message: NoaaPortMessage
+    ) -> None:
+        """Test that exceptions raised by async subscribers are logged."""
+
+        async def failing_handler(_message: NoaaPortMessage) -> None:
+            msg = "Handler failure"
+            raise RuntimeError(msg)
+
+        wx_wire.subscribe(failing_handler)
+
+        with patch("nwws_receiver.wx_wire.logger") as mock_logger:
+            await wx_wire._notify_subscribers(sample_message)
+            await asyncio.gather(*wx_wire._subscriber_tasks)
+
+            mock_logger.warning.assert_called_with(
+                "Async subscriber failed to process message - error: %s, error_type: %s",
+                "Handler failure",
+                "RuntimeError",
+            )
+
     def test_subscriber_count_property(self, wx_wire: WxWire) -> None:
         """Test that subscriber_count property returns correct count."""
         assert wx_wire.subscriber_count == 0